@@ -2,11 +2,39 @@
 
 import os
 from enum import Enum
-from typing import Optional, List, Union, Dict
+from functools import lru_cache
+from typing import Optional, FrozenSet, Tuple, Union, Dict
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 
 
+@lru_cache(maxsize=16)
+def _parse_host_port_string(raw: str) -> Tuple[Tuple[str, int], ...]:
+    """Parse a comma-separated "host:port" string, cached by its raw value."""
+    return _parse_host_port_list(raw.split(",") if raw else [])
+
+
+def _parse_host_port_list(v):
+    """Parse "host:port" entries (comma-separated string or list) into tuples."""
+    if isinstance(v, str):
+        return _parse_host_port_string(v)
+    if not isinstance(v, (list, tuple)):
+        return v
+    
+    hosts = []
+    for entry in v:
+        if isinstance(entry, str):
+            if ":" not in entry:
+                continue
+            host, port = entry.strip().rsplit(":", 1)
+            hosts.append((host, int(port)))
+        elif isinstance(entry, dict):
+            hosts.append((entry["host"], int(entry["port"])))
+        else:
+            hosts.append(tuple(entry))
+    return tuple(hosts)
+
+
 class RedisMode(str, Enum):
     """Redis connection mode."""
     SINGLE = "single"
@@ -32,11 +60,11 @@ class RedisSettings(BaseSettings):
         default=RedisMode.SINGLE,
         description="Redis connection mode: single, cluster, or sentinel"
     )
-    redis_cluster_nodes: Optional[Union[str, List[str]]] = Field(
+    redis_cluster_nodes: Optional[Union[str, Tuple[Tuple[str, int], ...]]] = Field(
         default=None,
         description="Comma-separated list of cluster nodes (host:port)"
     )
-    redis_sentinel_hosts: Optional[Union[str, List[Dict[str, Union[str, int]]]]] = Field(
+    redis_sentinel_hosts: Optional[Union[str, Tuple[Tuple[str, int], ...]]] = Field(
         default=None,
         description="Comma-separated list of sentinel hosts (host:port)"
     )
@@ -44,6 +72,10 @@ class RedisSettings(BaseSettings):
         default="mymaster",
         description="Sentinel service name"
     )
+    cluster_topology_ttl: float = Field(
+        default=5.0,
+        description="Seconds to cache CLUSTER NODES/INFO/SLOTS responses"
+    )
     
     # Connection pool settings
     redis_max_connections: int = Field(
@@ -66,6 +98,15 @@ class RedisSettings(BaseSettings):
         default=True,
         description="Enable socket keepalive"
     )
+    redis_socket_send_buffer: int = Field(
+        default=0,
+        description="SO_SNDBUF size in bytes for TCP connections; 0 keeps kernel autotuning, "
+                    "which a fixed size disables on Linux"
+    )
+    redis_decode_responses: bool = Field(
+        default=True,
+        description="Decode replies to str; disable to keep raw bytes for binary-heavy data"
+    )
     
     # Large key analysis settings
     large_key_threshold: int = Field(
@@ -82,43 +123,63 @@ class RedisSettings(BaseSettings):
     )
     
     # Command execution settings
-    dangerous_commands: List[str] = Field(
-        default_factory=lambda: [
+    dangerous_commands: FrozenSet[str] = Field(
+        default_factory=lambda: frozenset({
             "FLUSHDB", "FLUSHALL", "SHUTDOWN", "CONFIG", "EVAL", "EVALSHA",
             "SCRIPT", "DEBUG", "MONITOR", "SYNC", "PSYNC"
-        ],
-        description="List of dangerous commands to filter out"
+        }),
+        description="Set of dangerous commands to filter out"
     )
     enable_dangerous_commands: bool = Field(
         default=False,
         description="Whether to allow execution of dangerous commands"
     )
+    read_only: bool = Field(
+        default=False,
+        description="Treat every command the server flags as a write as dangerous"
+    )
     command_timeout: float = Field(
         default=30.0,
         description="Command execution timeout in seconds"
     )
+    pipeline_chunk_size: int = Field(
+        default=1000,
+        description="Maximum number of commands sent per pipeline flush"
+    )
+    database_probe_workers: int = Field(
+        default=8,
+        description="Databases sampled concurrently for summaries (1 samples them one at a time)"
+    )
     
     @field_validator("redis_cluster_nodes", mode="before")
     @classmethod
     def parse_cluster_nodes(cls, v):
-        """Parse cluster nodes from comma-separated string."""
-        if isinstance(v, str) and v:
-            return [node.strip() for node in v.split(",")]
-        return v
+        """Parse cluster nodes into (host, port) tuples."""
+        return _parse_host_port_list(v)
     
     @field_validator("redis_sentinel_hosts", mode="before")
     @classmethod
     def parse_sentinel_hosts(cls, v):
-        """Parse sentinel hosts from comma-separated string."""
-        if isinstance(v, str) and v:
-            return [
-                {"host": host.split(":")[0], "port": int(host.split(":")[1])}
-                for host in v.split(",")
-                if ":" in host
-            ]
+        """Parse sentinel hosts into (host, port) tuples."""
+        return _parse_host_port_list(v)
+    
+    @field_validator("dangerous_commands", mode="before")
+    @classmethod
+    def normalize_dangerous_commands(cls, v):
+        """Upper-case dangerous command names once at load time."""
+        if isinstance(v, str):
+            v = v.split(",")
+        if isinstance(v, (list, tuple, set, frozenset)):
+            return frozenset(cmd.strip().upper() for cmd in v if cmd.strip())
         return v
     
+    def is_dangerous(self, command: str) -> bool:
+        """Check whether a command name is in the dangerous command set."""
+        return command.upper() in self.dangerous_commands
+    
     model_config = {
         "env_prefix": "",
-        "case_sensitive": False
+        "case_sensitive": False,
+        # Build the validation schema on first instantiation, not at import
+        "defer_build": True
     }
\ No newline at end of file
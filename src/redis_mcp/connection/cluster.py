@@ -1,17 +1,96 @@
 """Redis cluster-specific management utilities."""
 
 import logging
-from typing import Dict, List, Any, Optional
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from redis.exceptions import RedisError, ResponseError
 
+from .crc16 import CLUSTER_SLOTS, keyslot, keyslots
 from .manager import RedisConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# CLUSTER NODES flags marking a node that should not be queried
+UNHEALTHY_NODE_FLAGS = frozenset({"fail", "fail?", "handshake", "noaddr"})
+
+
+@dataclass
+class ClusterSnapshot:
+    """Parsed CLUSTER INFO and CLUSTER NODES output."""
+    info: Dict[str, str]
+    nodes: List[Dict[str, Any]]
+    masters: List[Dict[str, Any]]
+    slaves: List[Dict[str, Any]]
+
+
+class TopologyRefresher(threading.Thread):
+    """Background thread that keeps the cluster topology cache warm."""
+    
+    def __init__(
+        self,
+        cluster_manager: "RedisClusterManager",
+        interval: float,
+        max_backoff: float = 60.0,
+        idle_timeout: Optional[float] = None
+    ):
+        """Initialize the refresher.
+        
+        Args:
+            cluster_manager: Cluster manager whose cache is refreshed
+            interval: Seconds between refreshes
+            max_backoff: Upper bound in seconds for the retry delay after failures
+            idle_timeout: Exit after this many seconds without a topology read
+                (defaults to ten intervals)
+        """
+        super().__init__(name="redis-mcp-topology-refresher", daemon=True)
+        self.cluster_manager = cluster_manager
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.idle_timeout = idle_timeout if idle_timeout is not None else interval * 10
+        self._stop_event = threading.Event()
+    
+    def run(self) -> None:
+        """Refresh the topology until stopped or idle, backing off exponentially on errors."""
+        attempt = 0
+        delay = self.interval
+        
+        while not self._stop_event.wait(delay):
+            if self.cluster_manager.idle_seconds() > self.idle_timeout:
+                logger.debug("No topology reads for %.1fs, stopping refresher", self.idle_timeout)
+                self.cluster_manager._refresher_exited(self)
+                return
+            try:
+                self.cluster_manager.refresh_topology()
+                attempt = 0
+                delay = self.interval
+            except Exception as e:
+                attempt += 1
+                delay = min(self.max_backoff, self.interval * 2 ** attempt)
+                logger.warning("Topology refresh failed (retrying in %.1fs): %s", delay, e)
+    
+    def stop(self) -> None:
+        """Ask the refresher to exit."""
+        self._stop_event.set()
+
 
 class RedisClusterManager:
     """Redis cluster-specific operations and utilities."""
     
+    __slots__ = (
+        "connection_manager",
+        "_cluster_cache",
+        "_current_epoch",
+        "_slot_table",
+        "_last_snapshot",
+        "_refresher",
+        "_last_read",
+    )
+    
     def __init__(self, connection_manager: RedisConnectionManager):
         """Initialize cluster manager.
         
@@ -19,70 +98,224 @@ class RedisClusterManager:
             connection_manager: Redis connection manager instance
         """
         self.connection_manager = connection_manager
+        # Topology responses keyed by name: {"value", "expiry"}; dropped
+        # when CLUSTER INFO reports a new cluster_current_epoch
+        self._cluster_cache: Dict[str, Dict[str, Any]] = {}
+        self._current_epoch: Optional[int] = None
+        # (CLUSTER SLOTS result, slot -> slot range lookup built from it),
+        # replaced as one tuple so readers never see a half-updated pair
+        self._slot_table: Optional[Tuple[List[Dict[str, Any]], List[Optional[Dict[str, Any]]]]] = None
+        self._last_snapshot: Optional[ClusterSnapshot] = None
+        self._refresher: Optional[TopologyRefresher] = None
+        # Monotonic time of the last foreground topology read
+        self._last_read: float = time.monotonic()
+    
+    def _cached(self, key: str, ttl: float, fetch_fn: Callable[[], Any]) -> Any:
+        """Return a cached topology value, refetching when stale.
+        
+        Args:
+            key: Cache entry name
+            ttl: Time to live in seconds
+            fetch_fn: Callable producing a fresh value
+            
+        Returns:
+            Cached or freshly fetched value
+        """
+        now = time.monotonic()
+        self._last_read = now
+        entry = self._cluster_cache.get(key)
+        if entry is not None and entry["expiry"] > now:
+            return entry["value"]
+        
+        value = fetch_fn()
+        self._cluster_cache[key] = {"value": value, "expiry": now + ttl}
+        return value
+    
+    def refresh_topology(self) -> None:
+        """Refetch the cluster topology into the cache.
+        
+        Queries a randomly chosen healthy primary from the last snapshot so
+        refreshes do not all land on the same node.
+        """
+        client = self.connection_manager.get_client()
+        target_node = None
+        candidates = [
+            node for node in (self._last_snapshot.masters if self._last_snapshot else ())
+            if node["link_state"] == "connected" and UNHEALTHY_NODE_FLAGS.isdisjoint(node["flags"])
+        ]
+        if candidates:
+            address = random.choice(candidates)["address"]
+            host, port = address.split("@", 1)[0].rsplit(":", 1)
+            if host and port.isdigit() and hasattr(client, "get_node"):
+                target_node = client.get_node(host=host, port=int(port))
+        
+        ttl = self.connection_manager.settings.cluster_topology_ttl
+        snapshot = self._fetch_cluster_snapshot(target_node)
+        slots = self._fetch_cluster_slots(target_node)
+        
+        expiry = time.monotonic() + ttl
+        self._cluster_cache["snapshot"] = {"value": snapshot, "expiry": expiry}
+        self._cluster_cache["slots"] = {"value": slots, "expiry": expiry}
+    
+    def idle_seconds(self) -> float:
+        """Seconds since the topology cache was last read."""
+        return time.monotonic() - self._last_read
+    
+    def _refresher_exited(self, refresher: TopologyRefresher) -> None:
+        """Forget a refresher that stopped on its own so the next read restarts it."""
+        if self._refresher is refresher:
+            self._refresher = None
+    
+    def _start_topology_refresher(self) -> None:
+        """Start the background refresher once the topology has been fetched."""
+        ttl = self.connection_manager.settings.cluster_topology_ttl
+        if self._refresher is not None or ttl <= 0:
+            return
+        
+        # Refresh at half the TTL so entries never expire between refreshes
+        self._refresher = TopologyRefresher(self, interval=ttl / 2)
+        self._refresher.start()
+        self.connection_manager.on_disconnect(self.stop_topology_refresher)
+    
+    def stop_topology_refresher(self) -> None:
+        """Stop the background topology refresher if it is running."""
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
+    
+    def invalidate_topology_cache(self) -> None:
+        """Drop all cached topology responses."""
+        self._cluster_cache.clear()
+        self._slot_table = None
     
     def get_cluster_info(self) -> Dict[str, Any]:
         """Get detailed cluster information.
         
+        Results are cached for ``cluster_topology_ttl`` seconds.
+        
         Returns:
             Dictionary containing cluster information
             
         Raises:
             RedisError: If not in cluster mode or operation fails
         """
+        snapshot = self._get_cluster_snapshot()
+        self._start_topology_refresher()
+        
+        return {
+            "cluster_info": snapshot.info,
+            "nodes": snapshot.nodes,
+            "total_nodes": len(snapshot.nodes),
+            "master_nodes": len(snapshot.masters),
+            "slave_nodes": len(snapshot.slaves)
+        }
+    
+    def _get_cluster_snapshot(self) -> ClusterSnapshot:
+        """Get the cached cluster snapshot, refetching when stale."""
+        return self._cached(
+            "snapshot",
+            self.connection_manager.settings.cluster_topology_ttl,
+            self._fetch_cluster_snapshot
+        )
+    
+    def _fetch_cluster_snapshot(self, target_node: Any = None) -> ClusterSnapshot:
+        """Fetch and parse CLUSTER NODES and CLUSTER INFO.
+        
+        Args:
+            target_node: Optional cluster node to query instead of the default
+        """
         client = self.connection_manager.get_client()
+        options = {"target_nodes": target_node} if target_node is not None else {}
         
         try:
             # Get cluster nodes information
-            cluster_nodes = client.execute_command("CLUSTER", "NODES")
-            cluster_info = client.execute_command("CLUSTER", "INFO")
+            cluster_nodes = client.execute_command("CLUSTER", "NODES", **options)
+            cluster_info = client.execute_command("CLUSTER", "INFO", **options)
+            if isinstance(cluster_nodes, bytes):
+                cluster_nodes = cluster_nodes.decode()
+                cluster_info = cluster_info.decode()
             
             # Parse cluster nodes
             nodes = []
-            for line in cluster_nodes.strip().split("\n"):
+            masters = []
+            slaves = []
+            for line in cluster_nodes.splitlines():
                 parts = line.split()
-                if len(parts) >= 8:
-                    node_info = {
-                        "id": parts[0],
-                        "address": parts[1],
-                        "flags": parts[2].split(","),
-                        "master_id": parts[3] if parts[3] != "-" else None,
-                        "ping_sent": int(parts[4]),
-                        "pong_recv": int(parts[5]),
-                        "config_epoch": int(parts[6]),
-                        "link_state": parts[7],
-                        "slots": parts[8:] if len(parts) > 8 else []
-                    }
-                    nodes.append(node_info)
+                if len(parts) < 8:
+                    continue
+                
+                node_id, address, flags, master_id, ping_sent, pong_recv, config_epoch, link_state, *slots = parts
+                ping_sent, pong_recv, config_epoch = map(int, (ping_sent, pong_recv, config_epoch))
+                flag_list = flags.split(",")
+                node = {
+                    "id": node_id,
+                    "address": address,
+                    "flags": flag_list,
+                    "master_id": master_id if master_id != "-" else None,
+                    "ping_sent": ping_sent,
+                    "pong_recv": pong_recv,
+                    "config_epoch": config_epoch,
+                    "link_state": link_state,
+                    "slots": slots
+                }
+                nodes.append(node)
+                
+                # Keep the payload in server order; the set is only for classification
+                flag_set = frozenset(flag_list)
+                if "master" in flag_set:
+                    masters.append(node)
+                if "slave" in flag_set:
+                    slaves.append(node)
             
             # Parse cluster info
-            info_dict = {}
-            for line in cluster_info.strip().split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    info_dict[key] = value
-            
-            return {
-                "cluster_info": info_dict,
-                "nodes": nodes,
-                "total_nodes": len(nodes),
-                "master_nodes": len([n for n in nodes if "master" in n["flags"]]),
-                "slave_nodes": len([n for n in nodes if "slave" in n["flags"]])
-            }
+            info_dict = dict(
+                line.split(":", 1) for line in cluster_info.splitlines() if ":" in line
+            )
+            
+            # A new cluster epoch means failover or resharding happened
+            current_epoch = int(info_dict.get("cluster_current_epoch", 0))
+            if self._current_epoch is not None and current_epoch != self._current_epoch:
+                self.invalidate_topology_cache()
+            self._current_epoch = current_epoch
+            
+            snapshot = ClusterSnapshot(
+                info=info_dict,
+                nodes=nodes,
+                masters=masters,
+                slaves=slaves
+            )
+            self._last_snapshot = snapshot
+            return snapshot
             
         except Exception as e:
-            logger.error(f"Failed to get cluster info: {e}")
+            logger.error("Failed to get cluster info: %s", e)
             raise RedisError(f"Failed to get cluster info: {e}")
     
     def get_cluster_slots(self) -> List[Dict[str, Any]]:
         """Get cluster slot distribution.
         
+        Results are cached for ``cluster_topology_ttl`` seconds.
+        
         Returns:
             List of slot ranges with their assigned nodes
         """
+        return self._cached(
+            "slots",
+            self.connection_manager.settings.cluster_topology_ttl,
+            self._fetch_cluster_slots
+        )
+    
+    def _fetch_cluster_slots(self, target_node: Any = None) -> List[Dict[str, Any]]:
+        """Fetch and parse CLUSTER SLOTS.
+        
+        Args:
+            target_node: Optional cluster node to query instead of the default
+        """
         client = self.connection_manager.get_client()
+        options = {"target_nodes": target_node} if target_node is not None else {}
         
         try:
-            slots_info = client.execute_command("CLUSTER", "SLOTS")
+            slots_info = client.execute_command("CLUSTER", "SLOTS", **options)
             
             slots = []
             for slot_range in slots_info:
@@ -112,43 +345,48 @@ class RedisClusterManager:
             return slots
             
         except Exception as e:
-            logger.error(f"Failed to get cluster slots: {e}")
+            logger.error("Failed to get cluster slots: %s", e)
             raise RedisError(f"Failed to get cluster slots: {e}")
     
     def get_node_keys_count(self) -> Dict[str, int]:
         """Get key count for each cluster node.
         
+        DBSIZE is sent to every primary concurrently; nodes that have not
+        replied within ``command_timeout`` are reported as unavailable.
+        
         Returns:
-            Dictionary mapping node addresses to key counts
+            Dictionary mapping node addresses to key counts (-1 if unavailable)
         """
         try:
-            cluster_info = self.get_cluster_info()
-            nodes = cluster_info["nodes"]
+            node_clients = self.connection_manager.get_cluster_node_clients()
+            if not node_clients:
+                return {}
             
             key_counts = {}
             
-            for node in nodes:
-                if "master" in node["flags"]:
+            executor = ThreadPoolExecutor(max_workers=min(32, len(node_clients)))
+            try:
+                futures = {
+                    address: executor.submit(node_client.dbsize)
+                    for address, node_client in node_clients
+                }
+                done, _ = wait(futures.values(), timeout=self.connection_manager.command_timeout)
+                for address, future in futures.items():
                     try:
-                        # For each master node, get the key count
-                        # This is an approximation using DBSIZE
-                        address = node["address"]
-                        if address.startswith("@"):
-                            continue  # Skip bus port addresses
-                        
-                        # Note: Getting exact key count per node in a cluster
-                        # requires connecting to each node individually
-                        # For now, we'll use the cluster info
-                        key_counts[address] = 0  # Placeholder
-                        
+                        if future not in done:
+                            raise TimeoutError("no reply before the command timeout")
+                        key_counts[address] = future.result()
                     except Exception as e:
-                        logger.warning(f"Failed to get key count for node {node['address']}: {e}")
-                        key_counts[node["address"]] = -1
+                        logger.warning("Failed to get key count for node %s: %s", address, e)
+                        key_counts[address] = -1
+            finally:
+                # Do not wait for nodes that are still hanging
+                executor.shutdown(wait=False, cancel_futures=True)
             
             return key_counts
             
         except Exception as e:
-            logger.error(f"Failed to get node key counts: {e}")
+            logger.error("Failed to get node key counts: %s", e)
             raise RedisError(f"Failed to get node key counts: {e}")
     
     def check_cluster_health(self) -> Dict[str, Any]:
@@ -158,46 +396,51 @@ class RedisClusterManager:
             Dictionary containing health information
         """
         try:
-            cluster_info = self.get_cluster_info()
-            cluster_state = cluster_info["cluster_info"].get("cluster_state", "unknown")
+            snapshot = self._get_cluster_snapshot()
+            cluster_state = snapshot.info.get("cluster_state", "unknown")
             
             health_status = {
                 "healthy": cluster_state == "ok",
                 "cluster_state": cluster_state,
-                "total_nodes": cluster_info["total_nodes"],
-                "master_nodes": cluster_info["master_nodes"],
-                "slave_nodes": cluster_info["slave_nodes"],
+                "total_nodes": len(snapshot.nodes),
+                "master_nodes": len(snapshot.masters),
+                "slave_nodes": len(snapshot.slaves),
                 "issues": []
             }
             
-            # Check for common issues
-            nodes = cluster_info["nodes"]
+            # Categorize nodes in a single pass
+            failed_nodes = []
+            handshake_nodes = []
+            slaves_by_master = defaultdict(list)
+            for node in snapshot.nodes:
+                flags = node["flags"]
+                if "fail" in flags:
+                    failed_nodes.append(node["address"])
+                if "handshake" in flags:
+                    handshake_nodes.append(node["address"])
+                if node["master_id"] is not None:
+                    slaves_by_master[node["master_id"]].append(node)
             
             # Check for failed nodes
-            failed_nodes = [n for n in nodes if "fail" in n["flags"]]
             if failed_nodes:
                 health_status["issues"].append({
                     "type": "failed_nodes",
                     "count": len(failed_nodes),
-                    "nodes": [n["address"] for n in failed_nodes]
+                    "nodes": failed_nodes
                 })
             
             # Check for nodes in handshake state
-            handshake_nodes = [n for n in nodes if "handshake" in n["flags"]]
             if handshake_nodes:
                 health_status["issues"].append({
                     "type": "handshake_nodes",
                     "count": len(handshake_nodes),
-                    "nodes": [n["address"] for n in handshake_nodes]
+                    "nodes": handshake_nodes
                 })
             
             # Check for masters without slaves
-            masters = [n for n in nodes if "master" in n["flags"]]
-            masters_without_slaves = []
-            for master in masters:
-                slaves = [n for n in nodes if n["master_id"] == master["id"]]
-                if not slaves:
-                    masters_without_slaves.append(master["address"])
+            masters_without_slaves = [
+                m["address"] for m in snapshot.masters if not slaves_by_master.get(m["id"])
+            ]
             
             if masters_without_slaves:
                 health_status["issues"].append({
@@ -209,9 +452,40 @@ class RedisClusterManager:
             return health_status
             
         except Exception as e:
-            logger.error(f"Failed to check cluster health: {e}")
+            logger.error("Failed to check cluster health: %s", e)
             raise RedisError(f"Failed to check cluster health: {e}")
     
+    def _rebuild_slot_table(self, slots_info: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Build a slot-indexed table mapping every hash slot to its slot range."""
+        table: List[Optional[Dict[str, Any]]] = [None] * CLUSTER_SLOTS
+        for slot_range in slots_info:
+            start, end = slot_range["start_slot"], slot_range["end_slot"] + 1
+            table[start:end] = [slot_range] * (end - start)
+        return table
+    
+    def _get_slot_table(self) -> List[Optional[Dict[str, Any]]]:
+        """Get the slot table, rebuilding it when CLUSTER SLOTS was refetched."""
+        slots_info = self.get_cluster_slots()
+        cached = self._slot_table
+        if cached is not None and cached[0] is slots_info:
+            return cached[1]
+        
+        table = self._rebuild_slot_table(slots_info)
+        self._slot_table = (slots_info, table)
+        return table
+    
+    @staticmethod
+    def _format_key_mapping(key: str, slot: int, slot_range: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Format the node mapping for a key, or None if its slot is unassigned."""
+        if slot_range is None:
+            return None
+        return {
+            "key": key,
+            "slot": slot,
+            "master_node": slot_range["master"],
+            "replica_nodes": slot_range["replicas"]
+        }
+    
     def get_key_node_mapping(self, key: str) -> Optional[Dict[str, Any]]:
         """Get the node responsible for a specific key.
         
@@ -221,26 +495,34 @@ class RedisClusterManager:
         Returns:
             Dictionary containing node information for the key
         """
-        client = self.connection_manager.get_client()
-        
         try:
-            # Get the slot for this key
-            slot = client.cluster_keyslot(key)
+            # Compute the slot locally instead of asking the server
+            slot = keyslot(key)
             
-            # Get cluster slots to find which node handles this slot
-            slots_info = self.get_cluster_slots()
+            return self._format_key_mapping(key, slot, self._get_slot_table()[slot])
             
-            for slot_range in slots_info:
-                if slot_range["start_slot"] <= slot <= slot_range["end_slot"]:
-                    return {
-                        "key": key,
-                        "slot": slot,
-                        "master_node": slot_range["master"],
-                        "replica_nodes": slot_range["replicas"]
-                    }
+        except Exception as e:
+            logger.error("Failed to get node mapping for key '%s': %s", key, e)
+            raise RedisError(f"Failed to get node mapping for key: {e}")
+    
+    def get_key_node_mapping_batch(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get the nodes responsible for several keys.
+        
+        Args:
+            keys: Redis keys to check
             
-            return None
+        Returns:
+            List of node mappings, in the same order as ``keys``
+        """
+        try:
+            slots = keyslots(keys)
+            table = self._get_slot_table()
+            
+            return [
+                self._format_key_mapping(key, slot, table[slot])
+                for key, slot in zip(keys, slots)
+            ]
             
         except Exception as e:
-            logger.error(f"Failed to get node mapping for key '{key}': {e}")
-            raise RedisError(f"Failed to get node mapping for key: {e}")
\ No newline at end of file
+            logger.error("Failed to get node mapping for %s keys: %s", len(keys), e)
+            raise RedisError(f"Failed to get node mapping for keys: {e}")
\ No newline at end of file
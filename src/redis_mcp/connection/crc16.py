@@ -0,0 +1,42 @@
+"""Client-side Redis cluster hash slot computation."""
+
+from binascii import crc_hqx
+from typing import Iterable, List, Union
+
+# Number of hash slots in a Redis cluster
+CLUSTER_SLOTS = 16384
+
+
+def keyslot(key: Union[str, bytes]) -> int:
+    """Compute the cluster hash slot for a key without a server round-trip.
+
+    Uses CRC16/XMODEM (``binascii.crc_hqx``) like Redis, hashing only the
+    ``{hashtag}`` part of the key when one is present.
+
+    Args:
+        key: Redis key
+
+    Returns:
+        Hash slot in the range 0-16383
+    """
+    data = key.encode("utf-8") if isinstance(key, str) else key
+
+    start = data.find(b"{")
+    if start != -1:
+        end = data.find(b"}", start + 1)
+        if end > start + 1:
+            data = data[start + 1:end]
+
+    return crc_hqx(data, 0) & (CLUSTER_SLOTS - 1)
+
+
+def keyslots(keys: Iterable[Union[str, bytes]]) -> List[int]:
+    """Compute cluster hash slots for many keys at once.
+    
+    Args:
+        keys: Redis keys
+        
+    Returns:
+        Hash slot for each key, in input order
+    """
+    return [keyslot(key) for key in keys]
\ No newline at end of file
@@ -1,11 +1,12 @@
 """Redis connection manager for single instance, cluster, and sentinel modes."""
 
 import logging
-from typing import Optional, Dict, Any, List, Union
-from urllib.parse import urlparse
+import socket
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Any, Iterator, List, Tuple, Union
 
 import redis
-from redis.sentinel import Sentinel
 from redis.exceptions import (
     ConnectionError,
     TimeoutError,
@@ -15,12 +16,51 @@ from redis.exceptions import (
 
 from ..config.settings import RedisSettings, RedisMode
 
+if TYPE_CHECKING:
+    from redis.sentinel import Sentinel
+
 logger = logging.getLogger(__name__)
 
+# Databases a Redis server has by default; per-database pools split
+# redis_max_connections across them
+DEFAULT_DATABASE_COUNT = 16
+
+
+class SendBufferConnection(redis.Connection):
+    """TCP connection with an enlarged kernel send buffer.
+    
+    redis-py already disables Nagle (``TCP_NODELAY``) on every TCP socket;
+    a larger ``SO_SNDBUF`` additionally lets big pipelines be written in one
+    go instead of blocking until the server drains the socket.
+    """
+    
+    send_buffer_size: int = 0
+    
+    def _connect(self) -> socket.socket:
+        sock = super()._connect()
+        if self.send_buffer_size:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        return sock
+
 
 class RedisConnectionManager:
     """Manages Redis connections for single, cluster, and sentinel modes."""
     
+    __slots__ = (
+        "settings",
+        "_client",
+        "_sentinel",
+        "_db_clients",
+        "_disconnect_callbacks",
+        "_current_db",
+        "_mode",
+        "command_timeout",
+        "_last_ok_ts",
+        "_liveness_window",
+        "_base_connection_params",
+        "_connection_class",
+    )
+    
     def __init__(self, settings: RedisSettings):
         """Initialize the connection manager.
         
@@ -29,8 +69,33 @@ class RedisConnectionManager:
         """
         self.settings = settings
         self._client: Optional[Union[redis.Redis, redis.RedisCluster]] = None
-        self._sentinel: Optional[Sentinel] = None
+        self._sentinel: Optional["Sentinel"] = None
+        # Clients bound to other logical databases, so callers never SELECT
+        self._db_clients: Dict[int, redis.Redis] = {}
+        self._disconnect_callbacks: List[Callable[[], None]] = []
         self._current_db: int = settings.redis_db
+        # Hot-path copies of settings consulted on every call
+        self._mode: RedisMode = settings.redis_mode
+        self.command_timeout: float = settings.command_timeout
+        # Monotonic time of the last successful round-trip; is_connected()
+        # trusts it for half the health check interval
+        self._last_ok_ts: float = 0.0
+        self._liveness_window: float = settings.redis_health_check_interval / 2
+        self._base_connection_params: Dict[str, Any] = {
+            "socket_connect_timeout": settings.redis_socket_connect_timeout,
+            "socket_keepalive": settings.redis_socket_keepalive,
+            "health_check_interval": settings.redis_health_check_interval,
+            "retry_on_timeout": settings.redis_retry_on_timeout,
+            "decode_responses": settings.redis_decode_responses,
+        }
+        # Only subclass the TCP connection when a send buffer is configured
+        self._connection_class: type = redis.Connection
+        if settings.redis_socket_send_buffer:
+            self._connection_class = type(
+                "SendBufferConnection",
+                (SendBufferConnection,),
+                {"send_buffer_size": settings.redis_socket_send_buffer}
+            )
         
     def connect(self) -> Union[redis.Redis, redis.RedisCluster]:
         """Establish Redis connection based on configuration.
@@ -42,61 +107,70 @@ class RedisConnectionManager:
             ConnectionError: If connection fails
         """
         try:
-            if self.settings.redis_mode == RedisMode.SINGLE:
+            if self._mode is RedisMode.SINGLE:
                 self._client = self._create_single_connection()
-            elif self.settings.redis_mode == RedisMode.CLUSTER:
+            elif self._mode is RedisMode.CLUSTER:
                 self._client = self._create_cluster_connection()
-            elif self.settings.redis_mode == RedisMode.SENTINEL:
+            elif self._mode is RedisMode.SENTINEL:
                 self._client = self._create_sentinel_connection()
             else:
-                raise ValueError(f"Unsupported Redis mode: {self.settings.redis_mode}")
+                raise ValueError(f"Unsupported Redis mode: {self._mode}")
                 
             # Test connection
             self._client.ping()
-            logger.info(f"Successfully connected to Redis in {self.settings.redis_mode} mode")
+            self._last_ok_ts = time.monotonic()
+            logger.info("Successfully connected to Redis in %s mode", self._mode)
             
             return self._client
             
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: %s", e)
             raise ConnectionError(f"Redis connection failed: {e}")
     
     def _create_single_connection(self) -> redis.Redis:
         """Create single Redis instance connection."""
+        connection_params = self._get_single_connection_params()
+        redis_url = self.settings.redis_url
+        # unix:// and rediss:// URLs need their own connection classes
+        if not redis_url or redis_url.startswith("redis://"):
+            connection_params["connection_class"] = self._get_connection_class()
+        
+        if redis_url:
+            client = redis.Redis.from_url(redis_url, **connection_params)
+            # The URL path may select a database other than redis_db
+            self._current_db = client.connection_pool.connection_kwargs.get("db", self._current_db)
+            return client
+        
+        return redis.Redis(**connection_params)
+    
+    def _get_single_connection_params(self) -> Dict[str, Any]:
+        """Get connection parameters for a single Redis instance.
+        
+        When ``redis_url`` is set the caller passes these to ``from_url``,
+        which lets anything given in the URL take precedence.
+        """
         connection_params = self._get_base_connection_params()
+        connection_params.update({
+            "db": self.settings.redis_db,
+            "password": self.settings.redis_password,
+        })
         
-        if self.settings.redis_url:
-            # Parse URL for connection
-            parsed_url = urlparse(self.settings.redis_url)
-            connection_params.update({
-                "host": parsed_url.hostname or self.settings.redis_host,
-                "port": parsed_url.port or self.settings.redis_port,
-                "db": int(parsed_url.path.lstrip("/") or self.settings.redis_db),
-                "password": parsed_url.password or self.settings.redis_password,
-            })
-        else:
+        if not self.settings.redis_url:
             connection_params.update({
                 "host": self.settings.redis_host,
                 "port": self.settings.redis_port,
-                "db": self.settings.redis_db,
-                "password": self.settings.redis_password,
             })
+        elif self.settings.redis_url.startswith("unix:"):
+            # TCP keepalive is not accepted by unix socket connections
+            connection_params.pop("socket_keepalive", None)
         
-        return redis.Redis(**connection_params)
+        return connection_params
     
     def _create_cluster_connection(self) -> redis.RedisCluster:
         """Create Redis cluster connection."""
-        if not self.settings.redis_cluster_nodes:
-            raise ValueError("Cluster nodes must be specified for cluster mode")
-        
-        startup_nodes = []
-        for node in self.settings.redis_cluster_nodes:
-            if isinstance(node, str) and ":" in node:
-                host, port = node.split(":", 1)
-                startup_nodes.append({"host": host, "port": int(port)})
-        
-        if not startup_nodes:
-            raise ValueError("No valid cluster nodes found")
+        startup_nodes = [
+            {"host": host, "port": port} for host, port in self._get_cluster_startup_nodes()
+        ]
         
         connection_params = self._get_base_connection_params()
         # Remove db parameter as it's not supported in cluster mode
@@ -105,50 +179,56 @@ class RedisConnectionManager:
         return redis.RedisCluster(
             startup_nodes=startup_nodes,
             password=self.settings.redis_password,
+            connection_class=self._get_connection_class(),
             **connection_params
         )
     
+    def _get_cluster_startup_nodes(self) -> List[Tuple[str, int]]:
+        """Get (host, port) pairs for the configured cluster nodes."""
+        if not self.settings.redis_cluster_nodes:
+            raise ValueError("Cluster nodes must be specified for cluster mode")
+        
+        return list(self.settings.redis_cluster_nodes)
+    
     def _create_sentinel_connection(self) -> redis.Redis:
         """Create Redis sentinel connection."""
-        if not self.settings.redis_sentinel_hosts:
-            raise ValueError("Sentinel hosts must be specified for sentinel mode")
-        
-        sentinels = self.settings.redis_sentinel_hosts
-        if isinstance(sentinels, str):
-            # Parse comma-separated sentinel hosts
-            sentinel_list = []
-            for host in sentinels.split(","):
-                if ":" in host:
-                    h, p = host.split(":", 1)
-                    sentinel_list.append((h.strip(), int(p)))
-            sentinels = sentinel_list
+        # Imported here so single-instance setups never touch sentinel code
+        from redis.sentinel import Sentinel
         
         self._sentinel = Sentinel(
-            sentinels,
+            self._get_sentinel_hosts(),
             socket_timeout=self.settings.redis_socket_connect_timeout,
             password=self.settings.redis_password,
         )
         
+        return self._sentinel.master_for(
+            self.settings.redis_sentinel_service,
+            **self._get_sentinel_connection_params()
+        )
+    
+    def _get_sentinel_hosts(self) -> List[Tuple[str, int]]:
+        """Get (host, port) pairs for the configured sentinels."""
+        if not self.settings.redis_sentinel_hosts:
+            raise ValueError("Sentinel hosts must be specified for sentinel mode")
+        
+        return list(self.settings.redis_sentinel_hosts)
+    
+    def _get_sentinel_connection_params(self) -> Dict[str, Any]:
+        """Get connection parameters for the sentinel-managed master."""
         connection_params = self._get_base_connection_params()
         connection_params.update({
             "db": self.settings.redis_db,
             "password": self.settings.redis_password,
         })
-        
-        return self._sentinel.master_for(
-            self.settings.redis_sentinel_service,
-            **connection_params
-        )
+        return connection_params
+    
+    def _get_connection_class(self) -> type:
+        """Get the TCP connection class for synchronous clients."""
+        return self._connection_class
     
     def _get_base_connection_params(self) -> Dict[str, Any]:
-        """Get base connection parameters."""
-        return {
-            "socket_connect_timeout": self.settings.redis_socket_connect_timeout,
-            "socket_keepalive": self.settings.redis_socket_keepalive,
-            "health_check_interval": self.settings.redis_health_check_interval,
-            "retry_on_timeout": self.settings.redis_retry_on_timeout,
-            "decode_responses": True,  # Always decode responses to strings
-        }
+        """Get a copy of the base connection parameters."""
+        return dict(self._base_connection_params)
     
     def get_client(self) -> Union[redis.Redis, redis.RedisCluster]:
         """Get the current Redis client.
@@ -163,8 +243,52 @@ class RedisConnectionManager:
             raise ConnectionError("Not connected to Redis. Call connect() first.")
         return self._client
     
+    def get_cluster_node_clients(self) -> List[Tuple[str, redis.Redis]]:
+        """Get a direct client for each cluster primary node.
+        
+        Returns:
+            List of (node address, node client) tuples
+            
+        Raises:
+            ResponseError: If not in cluster mode
+        """
+        if self._mode is not RedisMode.CLUSTER:
+            raise ResponseError("Per-node clients are only available in cluster mode")
+        
+        client = self.get_client()
+        return [
+            (node.name, client.get_redis_connection(node))
+            for node in client.get_primaries()
+        ]
+    
+    def on_disconnect(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run when disconnect() is called.
+        
+        Registering the same callback again is a no-op.
+        
+        Args:
+            callback: Function taking no arguments
+        """
+        if callback not in self._disconnect_callbacks:
+            self._disconnect_callbacks.append(callback)
+    
     def disconnect(self) -> None:
         """Close the Redis connection."""
+        for callback in self._disconnect_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("Disconnect callback failed: %s", e)
+        self._disconnect_callbacks.clear()
+        
+        self._last_ok_ts = 0.0
+        for db_client in self._db_clients.values():
+            try:
+                db_client.connection_pool.disconnect()
+            except Exception as e:
+                logger.warning("Error during disconnect: %s", e)
+        self._db_clients.clear()
+        
         if self._client:
             try:
                 if hasattr(self._client, "connection_pool"):
@@ -172,7 +296,7 @@ class RedisConnectionManager:
                 self._client = None
                 logger.info("Disconnected from Redis")
             except Exception as e:
-                logger.warning(f"Error during disconnect: {e}")
+                logger.warning("Error during disconnect: %s", e)
         
         if self._sentinel:
             self._sentinel = None
@@ -180,17 +304,24 @@ class RedisConnectionManager:
     def is_connected(self) -> bool:
         """Check if Redis connection is active.
         
+        Skips the PING when another command succeeded within half the
+        health check interval.
+        
         Returns:
             True if connected and responsive, False otherwise
         """
         if not self._client:
             return False
         
+        if time.monotonic() - self._last_ok_ts < self._liveness_window:
+            return True
+        
         try:
             self._client.ping()
+            self._last_ok_ts = time.monotonic()
             return True
         except Exception as e:
-            logger.warning(f"Connection check failed: {e}")
+            logger.warning("Connection check failed: %s", e)
             return False
     
     def get_info(self) -> Dict[str, Any]:
@@ -203,21 +334,37 @@ class RedisConnectionManager:
         
         try:
             info = client.info()
-            
-            # Add connection mode and current database
-            info["connection_mode"] = self.settings.redis_mode.value
-            info["current_database"] = self._current_db
-            
-            # Add cluster-specific info if in cluster mode
-            if self.settings.redis_mode == RedisMode.CLUSTER:
-                info["cluster_nodes"] = len(self.settings.redis_cluster_nodes or [])
-            
-            return info
+            self._last_ok_ts = time.monotonic()
+            return self._annotate_info(info)
             
         except Exception as e:
-            logger.error(f"Failed to get Redis info: {e}")
+            logger.error("Failed to get Redis info: %s", e)
             raise RedisError(f"Failed to get Redis info: {e}")
     
+    def load_command_table(self) -> Dict[str, Dict[str, Any]]:
+        """Fetch metadata for every server command with a single ``COMMAND`` call.
+        
+        Returns:
+            Command details keyed by upper-case name, with ``flags`` kept in
+            server order and a ``readonly`` shortcut
+        """
+        table = {}
+        for name, info in self.get_client().command().items():
+            table[name.upper()] = {**info, "readonly": "readonly" in info["flags"]}
+        return table
+    
+    def _annotate_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Add connection mode and database details to an INFO reply."""
+        # Add connection mode and current database
+        info["connection_mode"] = self._mode.value
+        info["current_database"] = self._current_db
+        
+        # Add cluster-specific info if in cluster mode
+        if self._mode is RedisMode.CLUSTER:
+            info["cluster_nodes"] = len(self.settings.redis_cluster_nodes or [])
+        
+        return info
+    
     def switch_database(self, db: int) -> bool:
         """Switch to a different Redis database.
         
@@ -230,7 +377,7 @@ class RedisConnectionManager:
         Note:
             Database switching is only supported in single instance mode
         """
-        if self.settings.redis_mode != RedisMode.SINGLE:
+        if self._mode is not RedisMode.SINGLE:
             raise ResponseError("Database switching is only supported in single instance mode")
         
         client = self.get_client()
@@ -238,13 +385,80 @@ class RedisConnectionManager:
         try:
             client.execute_command("SELECT", db)
             self._current_db = db
-            logger.info(f"Switched to database {db}")
+            logger.info("Switched to database %s", db)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to switch to database {db}: {e}")
+            logger.error("Failed to switch to database %s: %s", db, e)
             raise ResponseError(f"Failed to switch database: {e}")
     
+    def get_client_for_db(self, db: int) -> redis.Redis:
+        """Get a client whose connections are bound to a logical database.
+        
+        Each database gets its own pool, created on first use with the main
+        pool's connection settings and ``db`` fixed in the connection
+        arguments. A pool holds at most ``redis_max_connections // 16``
+        connections (never fewer than two, so a pinned client can still run
+        a pipeline) and callers wait up to ``command_timeout`` for a free
+        one, so probing every database at once cannot open connections
+        without limit. The current database is no exception: after
+        switch_database() other connections in the main pool may still be
+        on the old database. This avoids SELECT on shared pooled connections
+        and the round-trips needed to switch back.
+        
+        Args:
+            db: Database number
+            
+        Returns:
+            Redis client using ``db``
+        """
+        if self._mode is not RedisMode.SINGLE:
+            if db == self._current_db:
+                # Cluster and sentinel clients have a single database
+                return self.get_client()
+            raise ResponseError("Database selection is only supported in single instance mode")
+        
+        client = self._db_clients.get(db)
+        if client is None:
+            pool = self.get_client().connection_pool
+            max_connections = max(
+                2, self.settings.redis_max_connections // DEFAULT_DATABASE_COUNT
+            )
+            client = self._db_clients[db] = redis.Redis(
+                connection_pool=redis.BlockingConnectionPool(
+                    connection_class=pool.connection_class,
+                    max_connections=max_connections,
+                    timeout=self.command_timeout,
+                    **{**pool.connection_kwargs, "db": db}
+                )
+            )
+        return client
+    
+    @contextmanager
+    def client(self, db: Optional[int] = None) -> Iterator[Union[redis.Redis, redis.RedisCluster]]:
+        """Check out one pooled connection for a sequence of commands.
+        
+        Direct commands on the yielded client share a single connection,
+        taken from the pool on entry and returned once on exit, instead of
+        a checkout per command. Pipelines created from it still use their
+        own connection. Cluster clients route per command, so they are
+        yielded unchanged.
+        
+        Args:
+            db: Database to use (None for the current database)
+            
+        Yields:
+            Redis client pinned to one connection
+        """
+        client = self.get_client() if db is None else self.get_client_for_db(db)
+        
+        if self._mode is RedisMode.CLUSTER:
+            yield client
+            return
+        
+        with client.client() as pinned:
+            yield pinned
+    
     def get_current_database(self) -> int:
         """Get the current database number.
         
@@ -266,7 +480,9 @@ class RedisConnectionManager:
         client = self.get_client()
         
         try:
-            return client.execute_command(*args, **kwargs)
+            result = client.execute_command(*args, **kwargs)
+            self._last_ok_ts = time.monotonic()
+            return result
         except Exception as e:
-            logger.error(f"Command execution failed: {e}")
+            logger.error("Command execution failed: %s", e)
             raise
\ No newline at end of file
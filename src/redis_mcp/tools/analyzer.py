@@ -1,20 +1,69 @@
 """Large key analysis tool for Redis."""
 
+import heapq
 import logging
+import threading
 import time
-from typing import Dict, List, Any, Optional, Union, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union, Iterator
 from dataclasses import dataclass
-from collections import defaultdict
 
-from redis.exceptions import RedisError, ResponseError
+from redis.exceptions import NoPermissionError, NoScriptError, RedisError, ResponseError
 
 from ..connection.manager import RedisConnectionManager
 from ..config.settings import RedisSettings, RedisMode
 
 logger = logging.getLogger(__name__)
 
+# Size command for each key type
+SIZE_COMMANDS = {
+    "string": "strlen",
+    "list": "llen",
+    "set": "scard",
+    "zset": "zcard",
+    "hash": "hlen",
+    "stream": "xlen",
+}
 
-@dataclass
+# Returns {type, ttl, size, encoding, memory usage} for KEYS[1] in one call.
+# Size is -1 for types without a size command; encoding and memory usage are
+# nil when the server refuses OBJECT/MEMORY. ARGV[1] == "1" requests memory usage.
+KEY_METADATA_SCRIPT = """
+local key = KEYS[1]
+local key_type = redis.call('TYPE', key)['ok']
+if key_type == 'none' then
+    return {key_type}
+end
+
+local size_commands = {
+    string = 'STRLEN', list = 'LLEN', set = 'SCARD',
+    zset = 'ZCARD', hash = 'HLEN', stream = 'XLEN'
+}
+local size = -1
+if size_commands[key_type] then
+    size = redis.call(size_commands[key_type], key)
+end
+
+local ok, encoding = pcall(redis.call, 'OBJECT', 'ENCODING', key)
+if not ok then
+    encoding = false
+end
+
+local memory = false
+if ARGV[1] == '1' then
+    local ok_memory, usage = pcall(redis.call, 'MEMORY', 'USAGE', key)
+    if ok_memory then
+        memory = usage
+    end
+end
+
+return {key_type, redis.call('TTL', key), size, encoding, memory}
+"""
+
+
+@dataclass(slots=True)
 class KeyInfo:
     """Information about a Redis key."""
     key: str
@@ -25,7 +74,7 @@ class KeyInfo:
     memory_usage: Optional[int]
     
 
-@dataclass
+@dataclass(slots=True)
 class LargeKeyReport:
     """Report containing large key analysis results."""
     total_keys_scanned: int
@@ -37,6 +86,43 @@ class LargeKeyReport:
     top_keys_by_size: List[KeyInfo]
 
 
+class _ScanBudget:
+    """Key allowance shared by concurrent node scans."""
+    
+    __slots__ = ("remaining", "_lock")
+    
+    def __init__(self, limit: int):
+        self.remaining = limit
+        self._lock = threading.Lock()
+    
+    def claim(self, count: int) -> int:
+        """Reserve up to ``count`` keys and return how many were granted."""
+        with self._lock:
+            granted = min(count, self.remaining)
+            self.remaining -= granted
+            return granted
+    
+    def cancel(self) -> None:
+        """Stop every scan sharing this budget."""
+        with self._lock:
+            self.remaining = 0
+
+
+def _is_script_refusal(error: ResponseError) -> bool:
+    """Whether ``error`` means the server will not run scripts at all.
+    
+    Covers a script missing from the cache, ACL denial and scripting being
+    disabled or unknown, as opposed to a script failing on one key.
+    """
+    if isinstance(error, (NoScriptError, NoPermissionError)):
+        return True
+    message = str(error)
+    return (
+        message.startswith(("NOSCRIPT", "NOPERM", "unknown command"))
+        or "scripting is disabled" in message.lower()
+    )
+
+
 class LargeKeyAnalyzer:
     """Analyzer for finding and analyzing large keys in Redis."""
     
@@ -49,6 +135,14 @@ class LargeKeyAnalyzer:
         """
         self.connection_manager = connection_manager
         self.settings = settings
+        # Cluster scans pipeline against each node's own client, so scripts
+        # work in every mode; flips to False the first time the server
+        # refuses to run the metadata script
+        self._use_metadata_script = True
+        self._metadata_script = None
+        # None until the first reply shows whether the server allows the command
+        self._has_object_encoding: Optional[bool] = None
+        self._has_memory_usage: Optional[bool] = None
     
     def analyze_large_keys(
         self,
@@ -58,6 +152,10 @@ class LargeKeyAnalyzer:
     ) -> LargeKeyReport:
         """Analyze Redis keys to find large ones.
         
+        In cluster mode every primary is scanned in its own thread, so the
+        scan takes as long as the slowest node rather than the sum of all
+        nodes; ``limit`` caps the total across nodes.
+        
         Args:
             pattern: Key pattern to match (default: "*")
             limit: Maximum number of keys to scan (default: from settings)
@@ -67,7 +165,6 @@ class LargeKeyAnalyzer:
             LargeKeyReport containing analysis results
         """
         start_time = time.time()
-        client = self.connection_manager.get_client()
         
         if limit is None:
             limit = self.settings.max_scan_keys
@@ -77,222 +174,340 @@ class LargeKeyAnalyzer:
         total_memory = 0
         
         try:
-            # Scan keys based on Redis mode
             if self.settings.redis_mode == RedisMode.CLUSTER:
-                key_iterator = self._scan_cluster_keys(pattern, limit)
+                clients = [client for _, client in self.connection_manager.get_cluster_node_clients()]
             else:
-                key_iterator = self._scan_single_keys(pattern, limit)
+                clients = [self.connection_manager.get_client()]
+            budget = _ScanBudget(limit)
             
-            # Analyze each key
-            for key in key_iterator:
-                if total_scanned >= limit:
-                    break
-                
+            def analyze_node(client: Any) -> Tuple[List[KeyInfo], int, int]:
                 try:
-                    key_info = self._analyze_key(key, include_memory_usage)
-                    total_scanned += 1
-                    
-                    if key_info.size >= self.settings.large_key_threshold:
-                        large_keys.append(key_info)
-                        logger.debug(f"Found large key: {key} ({key_info.size} bytes)")
-                    
-                    if key_info.memory_usage:
-                        total_memory += key_info.memory_usage
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to analyze key '{key}': {e}")
-                    continue
-            
-            # Generate summary
-            summary_by_type = self._generate_type_summary(large_keys)
-            top_keys_by_size = sorted(large_keys, key=lambda x: x.size, reverse=True)[:50]
-            
-            scan_time = time.time() - start_time
+                    return self._analyze_node(client, pattern, budget, include_memory_usage)
+                except Exception:
+                    budget.cancel()
+                    raise
             
-            report = LargeKeyReport(
-                total_keys_scanned=total_scanned,
-                large_keys_found=len(large_keys),
-                total_memory_usage=total_memory,
-                scan_time_seconds=scan_time,
-                keys=large_keys,
-                summary_by_type=summary_by_type,
-                top_keys_by_size=top_keys_by_size
-            )
+            if len(clients) == 1:
+                node_results = [analyze_node(clients[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(32, len(clients))) as executor:
+                    node_results = list(executor.map(analyze_node, clients))
             
-            logger.info(
-                f"Large key analysis completed: {len(large_keys)} large keys found "
-                f"out of {total_scanned} keys scanned in {scan_time:.2f}s"
-            )
+            for node_large_keys, scanned, memory in node_results:
+                large_keys.extend(node_large_keys)
+                total_scanned += scanned
+                total_memory += memory
             
-            return report
+            return self._build_report(large_keys, total_scanned, total_memory, start_time)
             
         except Exception as e:
             logger.error(f"Large key analysis failed: {e}")
             raise RedisError(f"Large key analysis failed: {e}")
     
-    def _scan_single_keys(self, pattern: str, limit: int) -> Iterator[str]:
-        """Scan keys in single Redis instance mode."""
-        client = self.connection_manager.get_client()
-        cursor = 0
-        scanned = 0
-        
-        while scanned < limit:
-            cursor, keys = client.scan(
-                cursor=cursor,
-                match=pattern,
-                count=self.settings.scan_count
-            )
+    def _analyze_node(
+        self,
+        client: Any,
+        pattern: str,
+        budget: _ScanBudget,
+        include_memory_usage: bool
+    ) -> Tuple[List[KeyInfo], int, int]:
+        """Scan one node (or the single instance) and analyze its keys a batch at a time.
+        
+        Returns:
+            Tuple of (large keys, keys analyzed, memory usage of analyzed keys)
+        """
+        large_keys: List[KeyInfo] = []
+        total_scanned = 0
+        total_memory = 0
+        
+        for keys in self._scan_batches(client, pattern, budget):
+            results = self._analyze_batch(client, keys, include_memory_usage)
+            scanned, memory = self._tally_batch(keys, results, large_keys)
+            total_scanned += scanned
+            total_memory += memory
+        
+        return large_keys, total_scanned, total_memory
+    
+    def _tally_batch(
+        self,
+        keys: List[str],
+        results: List[Union[KeyInfo, Exception]],
+        large_keys: List[KeyInfo]
+    ) -> Tuple[int, int]:
+        """Collect large keys from an analyzed batch.
+        
+        Args:
+            keys: Keys of the batch
+            results: Output of the batch analysis for ``keys``
+            large_keys: List that large keys are appended to
             
-            for key in keys:
-                if scanned >= limit:
-                    break
-                yield key
-                scanned += 1
+        Returns:
+            Tuple of (keys analyzed, memory usage of analyzed keys)
+        """
+        threshold = self.settings.large_key_threshold
+        analyzed = []
+        
+        for key, key_info in zip(keys, results):
+            if isinstance(key_info, Exception):
+                logger.warning(f"Failed to analyze key '{key}': {key_info}")
+                continue
             
-            if cursor == 0:
-                break
+            analyzed.append(key_info)
+            
+            if key_info.size >= threshold:
+                large_keys.append(key_info)
+                logger.debug(f"Found large key: {key} ({key_info.size} bytes)")
+        
+        # One reduction per batch; None (unknown usage) is dropped by filter
+        memory = sum(filter(None, map(attrgetter("memory_usage"), analyzed)))
+        
+        return len(analyzed), memory
     
-    def _scan_cluster_keys(self, pattern: str, limit: int) -> Iterator[str]:
-        """Scan keys in Redis cluster mode."""
-        client = self.connection_manager.get_client()
-        scanned = 0
+    def _build_report(
+        self,
+        large_keys: List[KeyInfo],
+        total_scanned: int,
+        total_memory: int,
+        start_time: float
+    ) -> LargeKeyReport:
+        """Summarize collected large keys into a report."""
+        # Generate summary
+        summary_by_type = self._generate_type_summary(large_keys)
+        top_keys_by_size = heapq.nlargest(50, large_keys, key=lambda x: x.size)
         
-        # In cluster mode, scan each node
-        try:
-            nodes = client.get_nodes()
-            for node in nodes:
-                if scanned >= limit:
-                    break
-                
-                node_client = node
-                cursor = 0
-                
-                while scanned < limit:
-                    cursor, keys = node_client.scan(
-                        cursor=cursor,
-                        match=pattern,
-                        count=self.settings.scan_count
-                    )
-                    
-                    for key in keys:
-                        if scanned >= limit:
-                            break
-                        yield key
-                        scanned += 1
-                    
-                    if cursor == 0:
-                        break
-        except AttributeError:
-            # Fallback for different redis-py-cluster versions
-            cursor = 0
-            while scanned < limit:
-                try:
-                    cursor, keys = client.scan(
-                        cursor=cursor,
-                        match=pattern,
-                        count=self.settings.scan_count
-                    )
-                    
-                    for key in keys:
-                        if scanned >= limit:
-                            break
-                        yield key
-                        scanned += 1
-                    
-                    if cursor == 0:
-                        break
-                except Exception as e:
-                    logger.warning(f"Cluster scan error: {e}")
-                    break
+        scan_time = time.time() - start_time
+        
+        report = LargeKeyReport(
+            total_keys_scanned=total_scanned,
+            large_keys_found=len(large_keys),
+            total_memory_usage=total_memory,
+            scan_time_seconds=scan_time,
+            keys=large_keys,
+            summary_by_type=summary_by_type,
+            top_keys_by_size=top_keys_by_size
+        )
+        
+        logger.info(
+            f"Large key analysis completed: {len(large_keys)} large keys found "
+            f"out of {total_scanned} keys scanned in {scan_time:.2f}s"
+        )
+        
+        return report
+    
+    def _scan_batches(self, client: Any, pattern: str, budget: _ScanBudget) -> Iterator[List[str]]:
+        """Scan keys while the budget lasts, yielding them in batches of ``scan_count``."""
+        batch_size = self.settings.scan_count
+        keys = client.scan_iter(match=pattern, count=batch_size)
+        
+        while budget.remaining > 0 and (batch := list(islice(keys, batch_size))):
+            granted = budget.claim(len(batch))
+            if granted:
+                yield batch[:granted]
+            if granted < len(batch):
+                return
     
-    def _analyze_key(self, key: str, include_memory_usage: bool = True) -> KeyInfo:
-        """Analyze a single Redis key.
+    def _analyze_batch(
+        self,
+        client: Any,
+        keys: List[str],
+        include_memory_usage: bool = True
+    ) -> List[Union[KeyInfo, Exception]]:
+        """Analyze a batch of keys in pipelined round-trips.
+        
+        Where scripting is available, one pipeline runs KEY_METADATA_SCRIPT
+        per key. Otherwise the first pipeline fetches type, TTL, encoding and
+        memory usage for every key and the second fetches each key's size
+        with the command for its type.
         
         Args:
-            key: Redis key to analyze
+            client: Redis client to query
+            keys: Redis keys to analyze
             include_memory_usage: Whether to get memory usage info
             
         Returns:
-            KeyInfo object with key analysis results
+            KeyInfo for each key, or the exception that prevented analyzing it,
+            in the same order as ``keys``
         """
-        client = self.connection_manager.get_client()
+        if self._use_metadata_script:
+            try:
+                return self._analyze_batch_scripted(client, keys, include_memory_usage)
+            except ResponseError as e:
+                if _is_script_refusal(e):
+                    logger.warning(f"Metadata script unavailable, using plain commands: {e}")
+                    self._use_metadata_script = False
+                else:
+                    logger.warning(f"Metadata script failed, using plain commands for this batch: {e}")
         
-        try:
-            # Get key type
-            key_type = client.type(key)
-            if key_type == "none":
-                raise ValueError(f"Key '{key}' does not exist")
-            
-            # Get TTL
-            ttl = client.ttl(key)
-            if ttl == -1:
-                ttl = None  # Key has no expiration
-            
-            # Get key size based on type
-            size = self._get_key_size(key, key_type)
+        pipe = client.pipeline(transaction=False)
+        queued = self._queue_key_metadata(pipe, keys, include_memory_usage)
+        results, sized = self._parse_key_metadata(keys, pipe.execute(raise_on_error=False), *queued)
+        
+        if sized:
+            pipe = client.pipeline(transaction=False)
+            self._queue_key_sizes(pipe, sized)
+            self._apply_key_sizes(sized, pipe.execute(raise_on_error=False))
+        
+        return results
+    
+    def _analyze_batch_scripted(
+        self,
+        client: Any,
+        keys: List[str],
+        include_memory_usage: bool
+    ) -> List[Union[KeyInfo, Exception]]:
+        """Analyze a batch of keys with one KEY_METADATA_SCRIPT call per key.
+        
+        Errors for single keys are returned in place, as by the plain
+        command path; only a refusal to run the script at all is raised.
+        """
+        if self._metadata_script is None:
+            self._metadata_script = client.register_script(KEY_METADATA_SCRIPT)
+        
+        memory_arg = "1" if include_memory_usage else "0"
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            self._metadata_script(keys=[key], args=[memory_arg], client=pipe)
+        
+        results: List[Union[KeyInfo, Exception]] = []
+        for key, reply in zip(keys, pipe.execute(raise_on_error=False)):
+            if isinstance(reply, Exception):
+                if isinstance(reply, ResponseError) and _is_script_refusal(reply):
+                    raise reply
+                results.append(reply)
+                continue
             
-            # Get encoding information
-            encoding = None
-            try:
-                encoding = client.object("encoding", key)
-            except Exception:
-                # OBJECT command might not be available in all Redis versions/modes
-                pass
+            key_type = reply[0].decode() if isinstance(reply[0], bytes) else reply[0]
+            if key_type == "none":
+                results.append(ValueError(f"Key '{key}' does not exist"))
+                continue
             
-            # Get memory usage if requested and available
-            memory_usage = None
-            if include_memory_usage:
-                try:
-                    memory_usage = client.memory_usage(key)
-                except Exception:
-                    # MEMORY USAGE command might not be available
-                    pass
+            ttl, size, encoding, memory_usage = reply[1:]
+            if size == -1:
+                # For unknown types, try to get a reasonable estimate
+                size = len(str(key).encode('utf-8'))
             
-            return KeyInfo(
+            results.append(KeyInfo(
                 key=key,
                 type=key_type,
                 size=size,
-                ttl=ttl,
+                ttl=None if ttl == -1 else ttl,
                 encoding=encoding,
                 memory_usage=memory_usage
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to analyze key '{key}': {e}")
-            raise
+            ))
+        
+        return results
     
-    def _get_key_size(self, key: str, key_type: str) -> int:
-        """Get the size of a key based on its type.
+    def _queue_key_metadata(
+        self,
+        pipe: Any,
+        keys: List[str],
+        include_memory_usage: bool
+    ) -> Tuple[bool, bool]:
+        """Queue TYPE, TTL and, where supported, OBJECT ENCODING and MEMORY USAGE per key.
         
-        Args:
-            key: Redis key
-            key_type: Type of the key
-            
         Returns:
-            Size in bytes (approximate)
+            Tuple of (encoding queued, memory usage queued), to pass to
+            _parse_key_metadata
         """
-        client = self.connection_manager.get_client()
+        with_encoding = self._has_object_encoding is not False
+        with_memory = include_memory_usage and self._has_memory_usage is not False
         
-        try:
-            if key_type == "string":
-                return client.strlen(key)
-            elif key_type == "list":
-                return client.llen(key)
-            elif key_type == "set":
-                return client.scard(key) 
-            elif key_type == "zset":
-                return client.zcard(key)
-            elif key_type == "hash":
-                return client.hlen(key)
-            elif key_type == "stream":
-                return client.xlen(key)
+        for key in keys:
+            pipe.type(key)
+            pipe.ttl(key)
+            if with_encoding:
+                pipe.object("encoding", key)
+            if with_memory:
+                pipe.memory_usage(key)
+        
+        return with_encoding, with_memory
+    
+    def _parse_key_metadata(
+        self,
+        keys: List[str],
+        replies: List[Any],
+        with_encoding: bool,
+        with_memory: bool
+    ) -> Tuple[List[Union[KeyInfo, Exception]], List[KeyInfo]]:
+        """Build KeyInfo objects from the replies queued by _queue_key_metadata.
+        
+        A ResponseError from OBJECT or MEMORY USAGE (unknown command, ACL
+        denial) marks that command unsupported, so later batches skip it.
+        
+        Returns:
+            Tuple of (result per key, KeyInfo objects still needing a size)
+        """
+        stride = 2 + with_encoding + with_memory
+        results: List[Union[KeyInfo, Exception]] = []
+        sized = []
+        
+        for i, key in enumerate(keys):
+            key_type, ttl, *optional = replies[i * stride:(i + 1) * stride]
+            encoding = optional.pop(0) if with_encoding else None
+            memory_usage = optional.pop(0) if with_memory else None
+            
+            if isinstance(key_type, bytes):
+                key_type = key_type.decode()
+            if isinstance(key_type, Exception) or isinstance(ttl, Exception):
+                results.append(key_type if isinstance(key_type, Exception) else ttl)
+                continue
+            if key_type == "none":
+                results.append(ValueError(f"Key '{key}' does not exist"))
+                continue
+            
+            # OBJECT and MEMORY USAGE might not be available in all Redis versions/modes
+            if isinstance(encoding, Exception):
+                if isinstance(encoding, ResponseError):
+                    self._has_object_encoding = False
+                encoding = None
+            elif with_encoding:
+                self._has_object_encoding = True
+            if isinstance(memory_usage, Exception):
+                if isinstance(memory_usage, ResponseError):
+                    self._has_memory_usage = False
+                memory_usage = None
+            elif with_memory:
+                self._has_memory_usage = True
+            
+            key_info = KeyInfo(
+                key=key,
+                type=key_type,
+                size=0,
+                ttl=None if ttl == -1 else ttl,
+                encoding=encoding,
+                memory_usage=memory_usage
+            )
+            results.append(key_info)
+            
+            if key_type in SIZE_COMMANDS:
+                sized.append(key_info)
             else:
                 # For unknown types, try to get a reasonable estimate
-                return len(str(key).encode('utf-8'))
-                
-        except Exception as e:
-            logger.warning(f"Failed to get size for key '{key}' of type '{key_type}': {e}")
-            return 0
+                key_info.size = len(str(key).encode('utf-8'))
+        
+        return results, sized
+    
+    @staticmethod
+    def _queue_key_sizes(pipe: Any, sized: List[KeyInfo]) -> None:
+        """Queue the type-specific size command for each key."""
+        # Resolve each type's bound pipeline method once per batch
+        dispatch: Dict[str, Callable[[str], Any]] = {}
+        for key_info in sized:
+            queue_size = dispatch.get(key_info.type)
+            if queue_size is None:
+                queue_size = dispatch[key_info.type] = getattr(pipe, SIZE_COMMANDS[key_info.type])
+            queue_size(key_info.key)
+    
+    @staticmethod
+    def _apply_key_sizes(sized: List[KeyInfo], replies: List[Any]) -> None:
+        """Store the replies queued by _queue_key_sizes on their KeyInfo."""
+        for key_info, size in zip(sized, replies):
+            if isinstance(size, Exception):
+                logger.warning(
+                    f"Failed to get size for key '{key_info.key}' of type '{key_info.type}': {size}"
+                )
+                continue
+            key_info.size = size
     
     def _generate_type_summary(self, keys: List[KeyInfo]) -> Dict[str, Dict[str, Any]]:
         """Generate summary statistics by key type.
@@ -303,33 +518,31 @@ class LargeKeyAnalyzer:
         Returns:
             Dictionary with statistics by type
         """
-        summary = defaultdict(lambda: {
-            "count": 0,
-            "total_size": 0,
-            "avg_size": 0,
-            "max_size": 0,
-            "min_size": float('inf'),
-            "total_memory": 0
-        })
-        
+        # Bucket sizes and memory usage by type in a single pass
+        sizes_by_type: Dict[str, List[int]] = {}
+        memory_by_type: Dict[str, List[int]] = {}
         for key_info in keys:
-            type_stats = summary[key_info.type]
-            type_stats["count"] += 1
-            type_stats["total_size"] += key_info.size
-            type_stats["max_size"] = max(type_stats["max_size"], key_info.size)
-            type_stats["min_size"] = min(type_stats["min_size"], key_info.size)
-            
+            sizes = sizes_by_type.get(key_info.type)
+            if sizes is None:
+                sizes = sizes_by_type[key_info.type] = []
+                memory_by_type[key_info.type] = []
+            sizes.append(key_info.size)
             if key_info.memory_usage:
-                type_stats["total_memory"] += key_info.memory_usage
+                memory_by_type[key_info.type].append(key_info.memory_usage)
         
-        # Calculate averages and clean up
-        for type_name, stats in summary.items():
-            if stats["count"] > 0:
-                stats["avg_size"] = stats["total_size"] / stats["count"]
-                if stats["min_size"] == float('inf'):
-                    stats["min_size"] = 0
+        summary = {}
+        for type_name, sizes in sizes_by_type.items():
+            total_size = sum(sizes)
+            summary[type_name] = {
+                "count": len(sizes),
+                "total_size": total_size,
+                "avg_size": total_size / len(sizes),
+                "max_size": max(sizes),
+                "min_size": min(sizes),
+                "total_memory": sum(memory_by_type[type_name])
+            }
         
-        return dict(summary)
+        return summary
     
     def get_key_details(self, key: str) -> Dict[str, Any]:
         """Get detailed information about a specific key.
@@ -343,7 +556,32 @@ class LargeKeyAnalyzer:
         client = self.connection_manager.get_client()
         
         try:
-            key_info = self._analyze_key(key, include_memory_usage=True)
+            pipe = client.pipeline(transaction=False)
+            queued = self._queue_key_metadata(pipe, [key], True)
+            results, sized = self._parse_key_metadata([key], pipe.execute(raise_on_error=False), *queued)
+            key_info = results[0]
+            if isinstance(key_info, Exception):
+                raise key_info
+            
+            # Fetch the size together with a type-specific sample in one round-trip
+            pipe = client.pipeline(transaction=False)
+            self._queue_key_sizes(pipe, sized)
+            if key_info.type == "string":
+                # GETRANGE returns short values whole and slices large ones server-side
+                pipe.execute_command("GETRANGE", key, 0, 99, NEVER_DECODE=True)
+            elif key_info.type == "hash":
+                pipe.hkeys(key)
+            elif key_info.type == "list":
+                pipe.lrange(key, 0, 9)
+            elif key_info.type == "set":
+                pipe.srandmember(key, 10)
+            elif key_info.type == "zset":
+                pipe.zrange(key, 0, 9, withscores=True)
+            
+            replies = pipe.execute() if len(pipe) else []
+            if sized:
+                self._apply_key_sizes(sized, replies[:1])
+                replies = replies[1:]
             
             details = {
                 "key": key_info.key,
@@ -355,21 +593,25 @@ class LargeKeyAnalyzer:
                 "is_large": key_info.size >= self.settings.large_key_threshold
             }
             
-            # Add type-specific details
+            # Add type-specific details; counts are the size fetched above
             if key_info.type == "string":
-                details["value_preview"] = client.get(key)[:100] if key_info.size > 100 else client.get(key)
+                preview = replies[0]
+                if self.settings.redis_decode_responses:
+                    # A byte range can end mid-character; drop the partial tail
+                    preview = preview.decode("utf-8", errors="ignore")
+                details["value_preview"] = preview
             elif key_info.type == "hash":
-                details["field_count"] = client.hlen(key)
-                details["sample_fields"] = list(client.hkeys(key))[:10]
+                details["field_count"] = key_info.size
+                details["sample_fields"] = list(replies[0])[:10]
             elif key_info.type == "list":
-                details["length"] = client.llen(key) 
-                details["sample_values"] = client.lrange(key, 0, 9)
+                details["length"] = key_info.size
+                details["sample_values"] = replies[0]
             elif key_info.type == "set":
-                details["cardinality"] = client.scard(key)
-                details["sample_members"] = list(client.sscan(key, count=10)[1])
+                details["cardinality"] = key_info.size
+                details["sample_members"] = replies[0]
             elif key_info.type == "zset":
-                details["cardinality"] = client.zcard(key)
-                details["sample_members"] = client.zrange(key, 0, 9, withscores=True)
+                details["cardinality"] = key_info.size
+                details["sample_members"] = replies[0]
             
             return details
             
@@ -1,6 +1,7 @@
 """Database switching and management tool for Redis."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
@@ -12,7 +13,7 @@ from ..config.settings import RedisSettings, RedisMode
 logger = logging.getLogger(__name__)
 
 
-@dataclass 
+@dataclass(frozen=True, slots=True)
 class DatabaseInfo:
     """Information about a Redis database."""
     db_number: int
@@ -21,7 +22,7 @@ class DatabaseInfo:
     expires_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseSwitchResult:
     """Result of database switch operation."""
     success: bool
@@ -42,6 +43,8 @@ class DatabaseSwitcher:
         """
         self.connection_manager = connection_manager
         self.settings = settings
+        # Whether the server accepts FLUSHDB ASYNC (Redis 4.0+); None until tried
+        self._has_async_flush: Optional[bool] = None
     
     def switch_database(self, db_number: int) -> DatabaseSwitchResult:
         """Switch to a different Redis database.
@@ -125,61 +128,43 @@ class DatabaseSwitcher:
         current_db = self.get_current_database()
         databases = []
         
-        # Redis typically supports databases 0-15
+        # Memory usage is server-wide and the keyspace section has every
+        # database's expiring key count, so one INFO covers all databases
+        info = self._get_server_info(client)
+        memory_usage = info.get("used_memory") if info is not None else None
+        
+        # Redis typically supports databases 0-15; size them all in one round-trip
+        pipe = client.pipeline(transaction=False)
         for db_num in range(16):
-            try:
-                # Switch to database to check it
-                client.execute_command("SELECT", db_num)
-                
-                # Get database info
-                key_count = client.dbsize()
-                
-                # Try to get additional info (may not be available in all Redis versions)
-                memory_usage = None
-                expires_count = None
-                
-                try:
-                    # Get memory usage for this database
-                    info = client.info("memory")
-                    memory_usage = info.get("used_memory", None)
-                except Exception:
-                    pass
-                
-                # Count keys with expiration
-                try:
-                    # This is an approximation - we can't easily count expired keys without scanning
-                    expires_count = 0
-                except Exception:
-                    pass
-                
-                databases.append(DatabaseInfo(
-                    db_number=db_num,
-                    key_count=key_count,
-                    memory_usage=memory_usage,
-                    expires_count=expires_count
-                ))
-                
-                # If database is empty and we've found some databases, we can stop
-                if key_count == 0 and db_num > 0 and any(db.key_count > 0 for db in databases[:-1]):
-                    # Keep checking a few more to be sure
-                    continue
-                    
-            except ResponseError as e:
-                # Database might not exist or be accessible
-                if "invalid DB index" in str(e).lower():
-                    break  # No more databases available
-                else:
-                    logger.warning(f"Error accessing database {db_num}: {e}")
-                    continue
-            except Exception as e:
-                logger.warning(f"Error checking database {db_num}: {e}")
+            pipe.execute_command("SELECT", db_num)
+            pipe.dbsize()
+        pipe.execute_command("SELECT", current_db)
+        replies = pipe.execute(raise_on_error=False)
+        
+        for db_num, (selected, key_count) in enumerate(zip(replies[0:-1:2], replies[1::2])):
+            if isinstance(selected, ResponseError) and "db index" in str(selected).lower():
+                break  # No more databases available
+            
+            error = selected if isinstance(selected, Exception) else key_count
+            if isinstance(error, Exception):
+                logger.warning(f"Error accessing database {db_num}: {error}")
                 continue
+            
+            if info is not None:
+                expires_count = self._keyspace_entry(info, db_num)["expires"]
+            else:
+                # Unknown without INFO; get_database_info can sample it
+                expires_count = 0 if key_count == 0 else None
+            
+            databases.append(DatabaseInfo(
+                db_number=db_num,
+                key_count=key_count,
+                memory_usage=memory_usage,
+                expires_count=expires_count
+            ))
         
-        # Switch back to original database
-        try:
-            client.execute_command("SELECT", current_db)
-        except Exception as e:
-            logger.error(f"Failed to switch back to original database {current_db}: {e}")
+        if isinstance(replies[-1], Exception):
+            logger.error(f"Failed to switch back to original database {current_db}: {replies[-1]}")
         
         return databases
     
@@ -198,85 +183,110 @@ class DatabaseSwitcher:
         if db_number is None:
             db_number = self.get_current_database()
         
-        client = self.connection_manager.get_client()
-        current_db = self.get_current_database()
-        
         try:
-            # Switch to target database if different
-            if db_number != current_db:
-                client.execute_command("SELECT", db_number)
-            
-            # Get basic info
-            key_count = client.dbsize()
-            
-            # Get memory usage
-            memory_usage = None
-            try:
-                info = client.info("memory")
-                memory_usage = info.get("used_memory", None)
-            except Exception:
-                pass
-            
-            # Count keys with TTL (expensive operation, so we sample)
-            expires_count = None
-            try:
-                if key_count > 0:
-                    # Sample some keys to estimate expiring keys
-                    cursor = 0
-                    sampled_keys = 0
-                    expiring_keys = 0
-                    max_sample = min(1000, key_count)
-                    
-                    while sampled_keys < max_sample:
-                        cursor, keys = client.scan(cursor=cursor, count=100)
-                        for key in keys:
-                            sampled_keys += 1
-                            if sampled_keys > max_sample:
-                                break
-                            
-                            ttl = client.ttl(key)
-                            if ttl > 0:  # Key has expiration
-                                expiring_keys += 1
-                        
-                        if cursor == 0:
-                            break
-                    
-                    # Estimate total expiring keys
-                    if sampled_keys > 0:
-                        expires_count = int((expiring_keys / sampled_keys) * key_count)
-            except Exception as e:
-                logger.warning(f"Failed to count expiring keys: {e}")
-            
-            database_info = DatabaseInfo(
-                db_number=db_number,
-                key_count=key_count,
-                memory_usage=memory_usage,
-                expires_count=expires_count
-            )
-            
-            # Switch back to original database if we changed it
-            if db_number != current_db:
-                client.execute_command("SELECT", current_db)
-            
-            return database_info
+            # A client bound to the target database, so no SELECT is needed;
+            # its direct commands share one pooled connection
+            with self.connection_manager.client(db_number) as client:
+                info = self._get_server_info(client)
+                
+                if info is not None:
+                    # INFO keyspace has exact key and expiring key counts
+                    keyspace = self._keyspace_entry(info, db_number)
+                    return DatabaseInfo(
+                        db_number=db_number,
+                        key_count=keyspace["keys"],
+                        memory_usage=info.get("used_memory"),
+                        expires_count=keyspace["expires"]
+                    )
+                
+                key_count = client.dbsize()
+                
+                # Count keys with TTL (expensive operation, so we sample)
+                expires_count = None
+                try:
+                    if key_count > 0:
+                        expires_count = self._sample_expiring_keys(client, key_count)
+                except Exception as e:
+                    logger.warning(f"Failed to count expiring keys: {e}")
+                
+                return DatabaseInfo(
+                    db_number=db_number,
+                    key_count=key_count,
+                    expires_count=expires_count
+                )
             
         except Exception as e:
-            # Make sure we switch back to original database
-            try:
-                if db_number != current_db:
-                    client.execute_command("SELECT", current_db)
-            except Exception:
-                pass
-            
             logger.error(f"Failed to get info for database {db_number}: {e}")
             raise RedisError(f"Failed to get database info: {e}")
     
-    def clear_database(self, db_number: Optional[int] = None, confirm: bool = False) -> Dict[str, Any]:
+    @staticmethod
+    def _get_server_info(client: Any) -> Optional[Dict[str, Any]]:
+        """Fetch the default INFO sections, which include memory and keyspace.
+        
+        Returns:
+            Parsed INFO reply, or None if INFO is unavailable (e.g. denied by ACL)
+        """
+        try:
+            return client.info()
+        except Exception as e:
+            logger.warning(f"INFO unavailable, falling back to sampling: {e}")
+            return None
+    
+    @staticmethod
+    def _keyspace_entry(info: Dict[str, Any], db_number: int) -> Dict[str, int]:
+        """Get a database's INFO keyspace entry; empty databases are not listed."""
+        return info.get(f"db{db_number}") or {"keys": 0, "expires": 0}
+    
+    @staticmethod
+    def _sample_expiring_keys(client: Any, key_count: int) -> Optional[int]:
+        """Estimate expiring keys by sampling TTLs of up to 1000 keys.
+        
+        Args:
+            client: Client bound to the database to sample
+            key_count: Number of keys in the database
+            
+        Returns:
+            Estimated number of keys with a TTL, or None if nothing was sampled
+        """
+        cursor = 0
+        sampled_keys = 0
+        expiring_keys = 0
+        max_sample = min(1000, key_count)
+        
+        while sampled_keys < max_sample:
+            cursor, keys = client.scan(cursor=cursor, count=500)
+            keys = keys[:max_sample - sampled_keys]
+            
+            if keys:
+                # One round-trip for the TTLs of the whole SCAN page
+                pipe = client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = pipe.execute()
+                
+                sampled_keys += len(ttls)
+                expiring_keys += sum(1 for ttl in ttls if ttl > 0)
+            
+            if cursor == 0:
+                break
+        
+        if sampled_keys == 0:
+            return None
+        return int((expiring_keys / sampled_keys) * key_count)
+    
+    def clear_database(
+        self,
+        db_number: Optional[int] = None,
+        confirm: bool = False,
+        async_mode: bool = True
+    ) -> Dict[str, Any]:
         """Clear all keys in a database (FLUSHDB).
         
         Args:
             db_number: Database number to clear (None for current database)
             confirm: Must be True to actually clear the database
+            async_mode: Use FLUSHDB ASYNC so keys are freed by a background
+                thread instead of blocking the server (Redis 4.0+)
             
         Returns:
             Dictionary with operation result
@@ -303,42 +313,33 @@ class DatabaseSwitcher:
         if db_number is None:
             db_number = self.get_current_database()
         
-        client = self.connection_manager.get_client()
-        current_db = self.get_current_database()
-        
         try:
-            # Get key count before clearing
-            if db_number != current_db:
-                client.execute_command("SELECT", db_number)
-            
-            keys_before = client.dbsize()
-            
-            # Clear the database
-            client.flushdb()
-            
-            keys_after = client.dbsize()
-            
-            # Switch back to original database if we changed it
-            if db_number != current_db:
-                client.execute_command("SELECT", current_db)
+            with self.connection_manager.client(db_number) as client:
+                # Get key count before clearing
+                keys_before = client.dbsize()
+                
+                # Clear the database
+                async_mode = self._flushdb(client, async_mode)
+                
+                keys_after = client.dbsize()
             
-            logger.warning(f"Cleared database {db_number}: {keys_before} keys deleted")
+            if async_mode:
+                logger.warning(
+                    f"Cleared database {db_number}: {keys_before} keys deleted, "
+                    f"memory is reclaimed in the background"
+                )
+            else:
+                logger.warning(f"Cleared database {db_number}: {keys_before} keys deleted")
             
             return {
                 "success": True,
                 "database": db_number,
                 "keys_deleted": keys_before,
-                "keys_remaining": keys_after
+                "keys_remaining": keys_after,
+                "async_mode": async_mode
             }
             
         except Exception as e:
-            # Make sure we switch back to original database
-            try:
-                if db_number != current_db:
-                    client.execute_command("SELECT", current_db)
-            except Exception:
-                pass
-            
             error_msg = str(e)
             logger.error(f"Failed to clear database {db_number}: {error_msg}")
             return {
@@ -346,6 +347,65 @@ class DatabaseSwitcher:
                 "error": error_msg
             }
     
+    def _flushdb(self, client: Any, async_mode: bool) -> bool:
+        """Run FLUSHDB, asynchronously if requested and supported.
+        
+        Servers older than Redis 4.0 reject the ASYNC flag; that is
+        remembered and plain FLUSHDB is used from then on.
+        
+        Args:
+            client: Client bound to the database to clear
+            async_mode: Whether FLUSHDB ASYNC was requested
+            
+        Returns:
+            True if the database was flushed asynchronously
+        """
+        if async_mode and self._has_async_flush is not False:
+            try:
+                client.flushdb(asynchronous=True)
+                self._has_async_flush = True
+                return True
+            except ResponseError as e:
+                logger.warning(f"FLUSHDB ASYNC not supported, falling back to FLUSHDB: {e}")
+                self._has_async_flush = False
+        
+        client.flushdb()
+        return False
+    
+    def _probe_databases(self, databases: List[DatabaseInfo]) -> List[DatabaseInfo]:
+        """Replace listed databases lacking expiring key counts with sampled details.
+        
+        Counts are only missing when INFO keyspace was unavailable.
+        
+        Sampling TTLs takes several round-trips per database, so databases
+        are probed concurrently, each over its own per-database client.
+        
+        Args:
+            databases: Output of ``list_databases``
+            
+        Returns:
+            Databases in the same order, with expiring key estimates where
+            sampling succeeded
+        """
+        def probe(database: DatabaseInfo) -> DatabaseInfo:
+            if database.expires_count is not None:
+                return database
+            try:
+                return self.get_database_info(database.db_number)
+            except Exception as e:
+                logger.warning(f"Failed to sample database {database.db_number}: {e}")
+                return database
+        
+        if all(database.expires_count is not None for database in databases):
+            return databases
+        
+        workers = min(self.settings.database_probe_workers, len(databases))
+        if workers <= 1:
+            return [probe(database) for database in databases]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="redis-mcp-db-probe") as executor:
+            return list(executor.map(probe, databases))
+    
     def get_database_summary(self) -> Dict[str, Any]:
         """Get a summary of all databases.
         
@@ -363,7 +423,7 @@ class DatabaseSwitcher:
                     "note": "Database switching is not supported in cluster/sentinel mode"
                 }
             
-            databases = self.list_databases()
+            databases = self._probe_databases(self.list_databases())
             current_db = self.get_current_database()
             
             total_keys = sum(db.key_count for db in databases)
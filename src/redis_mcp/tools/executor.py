@@ -2,18 +2,95 @@
 
 import logging
 import time
-from typing import Any, Dict, List, Optional, Union
+from itertools import islice
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 
 from redis.exceptions import RedisError, ResponseError, TimeoutError
 
 from ..connection.manager import RedisConnectionManager
-from ..config.settings import RedisSettings
+from ..config.settings import RedisSettings, RedisMode
 
 logger = logging.getLogger(__name__)
 
+# Replies larger than these are summarized instead of returned in full
+MAX_LIST_ITEMS = 100
+MAX_DICT_FIELDS = 50
+MAX_STRING_LENGTH = 1000
 
-@dataclass
+# Commands whose list replies are always returned in full
+KEY_LIST_COMMANDS = frozenset({"KEYS", "SCAN"})
+
+# Commands whose bulk replies are opaque binary, so decoding is not attempted.
+# Integer replies (DBSIZE, INCR, TTL, ...) already arrive as int and skip
+# formatting altogether.
+BINARY_REPLY_COMMANDS = frozenset({"DUMP"})
+
+
+def _format_command(command: str, args: Any) -> str:
+    """Render a command and its arguments for results and error logs."""
+    return f"{command} {' '.join(map(str, args))}"
+
+
+def _format_bytes(result: bytes, command: str) -> Any:
+    """Decode a bulk string reply, describing undecodable binary data."""
+    if command and command.split(maxsplit=1)[0].upper() in BINARY_REPLY_COMMANDS:
+        return f"<binary data: {len(result)} bytes>"
+    try:
+        return result.decode('utf-8')
+    except UnicodeDecodeError:
+        return f"<binary data: {len(result)} bytes>"
+
+
+def _format_list(result: list, command: str) -> Any:
+    """Summarize long list replies, except key listings."""
+    if len(result) <= MAX_LIST_ITEMS:
+        return result
+    if command and command.split(maxsplit=1)[0].upper() in KEY_LIST_COMMANDS:
+        return result  # Keep as is for key lists
+    return {
+        "total_items": len(result),
+        "sample_items": result[:10],
+        "truncated": True
+    }
+
+
+def _format_dict(result: dict, command: str) -> Any:
+    """Summarize replies with many fields, such as INFO."""
+    if len(result) <= MAX_DICT_FIELDS:
+        return result
+    return {
+        "total_fields": len(result),
+        "sample_fields": dict(islice(result.items(), 10)),
+        "truncated": True
+    }
+
+
+def _format_str(result: str, command: str) -> Any:
+    """Truncate very long string replies."""
+    if len(result) <= MAX_STRING_LENGTH:
+        return result
+    return {
+        "length": len(result),
+        "preview": f"{result[:500]}...",
+        "truncated": True
+    }
+
+
+_RESULT_FORMATTERS: Dict[type, Callable[[Any, str], Any]] = {
+    bytes: _format_bytes,
+    list: _format_list,
+    dict: _format_dict,
+    str: _format_str,
+}
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter_ns()`` reading."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """Result of a Redis command execution."""
     command: str
@@ -24,14 +101,43 @@ class CommandResult:
     warning: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BatchCommandResult:
     """Result of batch command execution."""
     total_commands: int
     successful_commands: int
     failed_commands: int
     total_time_ms: float
-    results: List[CommandResult]
+    results: Sequence[CommandResult]
+
+
+class _RejectedResults(Sequence):
+    """Failed results for a whole rejected batch, built only when accessed.
+    
+    A rejected batch shares one error message, so this avoids allocating a
+    CommandResult per command up front; indexing and iteration still yield
+    one result per command, and safe_json_serialize encodes it as a list.
+    """
+    
+    __slots__ = ("_commands", "_error")
+    
+    def __init__(self, commands: List[Union[str, List[str]]], error: str):
+        self._commands = commands
+        self._error = error
+    
+    def __len__(self) -> int:
+        return len(self._commands)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return CommandResult(
+            command=str(self._commands[index]),
+            success=False,
+            result=None,
+            execution_time_ms=0,
+            error=self._error
+        )
 
 
 class CommandExecutor:
@@ -46,6 +152,12 @@ class CommandExecutor:
         """
         self.connection_manager = connection_manager
         self.settings = settings
+        # COMMAND table keyed by upper-case name; fixed for the server's lifetime
+        self._cmdinfo_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        # Upper-case names flagged "write", derived from the cached table
+        self._write_commands: FrozenSet[str] = frozenset()
+        # None until probed; False when the server refuses CLIENT REPLY
+        self._has_client_reply: Optional[bool] = None
     
     def execute_command(self, command: str, *args, **kwargs) -> CommandResult:
         """Execute a single Redis command with safety checks.
@@ -58,111 +170,146 @@ class CommandExecutor:
         Returns:
             CommandResult with execution details
         """
-        full_command = f"{command} {' '.join(map(str, args))}"
-        start_time = time.time()
+        full_command = _format_command(command, args)
+        start_ns = time.perf_counter_ns()
+        
+        blocked, warning = self._check_command(command, full_command)
+        if blocked is not None:
+            return blocked
         
         try:
-            # Check if command is dangerous
-            if self._is_dangerous_command(command):
-                if not self.settings.enable_dangerous_commands:
-                    return CommandResult(
-                        command=full_command,
-                        success=False,
-                        result=None,
-                        execution_time_ms=0,
-                        error=f"Command '{command}' is blocked for safety. "
-                               f"Enable dangerous commands to use it."
-                    )
-                else:
-                    warning = f"Warning: Executing dangerous command '{command}'"
-                    logger.warning(warning)
-            
             client = self.connection_manager.get_client()
             
             # Execute command with timeout
             result = client.execute_command(command, *args, **kwargs)
-            execution_time = (time.time() - start_time) * 1000
-            
-            # Format result for better readability
-            formatted_result = self._format_result(result, command)
-            
-            logger.info(f"Executed command: {full_command} ({execution_time:.2f}ms)")
-            
-            return CommandResult(
-                command=full_command,
-                success=True,
-                result=formatted_result,
-                execution_time_ms=execution_time,
-                warning=warning if self._is_dangerous_command(command) else None
-            )
-            
-        except TimeoutError as e:
-            error_msg = f"Command timed out after {self.settings.command_timeout}s"
-            logger.error(f"Command timeout: {full_command} - {error_msg}")
-            return CommandResult(
-                command=full_command,
-                success=False,
-                result=None,
-                execution_time_ms=(time.time() - start_time) * 1000,
-                error=error_msg
-            )
-            
-        except (RedisError, ResponseError) as e:
-            error_msg = str(e)
-            logger.error(f"Redis error executing {full_command}: {error_msg}")
-            return CommandResult(
-                command=full_command,
-                success=False,
-                result=None,
-                execution_time_ms=(time.time() - start_time) * 1000,
-                error=error_msg
-            )
+            return self._completed_command(full_command, command, result, start_ns, warning)
             
         except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(f"Unexpected error executing {full_command}: {error_msg}")
+            return self._failed_command(full_command, start_ns, e)
+    
+    def _check_command(self, command: str, full_command: str) -> Tuple[Optional[CommandResult], Optional[str]]:
+        """Classify a command once before running it.
+        
+        Args:
+            command: Command name
+            full_command: Command with its arguments, for the result
+            
+        Returns:
+            ``(blocked result, warning)``; the blocked result is None when
+            the command may run
+        """
+        if not self._is_dangerous_command(command):
+            return None, None
+        
+        if not self.settings.enable_dangerous_commands:
             return CommandResult(
                 command=full_command,
                 success=False,
                 result=None,
-                execution_time_ms=(time.time() - start_time) * 1000,
-                error=error_msg
-            )
+                execution_time_ms=0,
+                error=f"Command '{command}' is blocked for safety. "
+                       f"Enable dangerous commands to use it."
+            ), None
+        
+        warning = f"Warning: Executing dangerous command '{command}'"
+        logger.warning(warning)
+        return None, warning
+    
+    def _completed_command(
+        self,
+        full_command: str,
+        command: str,
+        result: Any,
+        start_ns: int,
+        warning: Optional[str]
+    ) -> CommandResult:
+        """Build the result of a command that returned a reply."""
+        execution_time = _elapsed_ms(start_ns)
+        
+        # Format result for better readability
+        formatted_result = self._format_result(result, command)
+        
+        logger.info("Executed command: %s (%.2fms)", full_command, execution_time)
+        
+        return CommandResult(
+            command=full_command,
+            success=True,
+            result=formatted_result,
+            execution_time_ms=execution_time,
+            warning=warning
+        )
+    
+    def _failed_command(self, full_command: str, start_ns: int, error: Exception) -> CommandResult:
+        """Build the result of a command that raised."""
+        if isinstance(error, TimeoutError):
+            error_msg = f"Command timed out after {self.settings.command_timeout}s"
+            logger.error("Command timeout: %s - %s", full_command, error_msg)
+        elif isinstance(error, RedisError):
+            error_msg = str(error)
+            logger.error("Redis error executing %s: %s", full_command, error_msg)
+        else:
+            error_msg = f"Unexpected error: {str(error)}"
+            logger.error("Unexpected error executing %s: %s", full_command, error_msg)
+        
+        return CommandResult(
+            command=full_command,
+            success=False,
+            result=None,
+            execution_time_ms=_elapsed_ms(start_ns),
+            error=error_msg
+        )
     
-    def execute_batch_commands(self, commands: List[Union[str, List[str]]]) -> BatchCommandResult:
+    def execute_batch_commands(
+        self,
+        commands: List[Union[str, List[str]]],
+        fire_and_forget: bool = False
+    ) -> BatchCommandResult:
         """Execute multiple Redis commands.
         
         Args:
             commands: List of commands. Each command can be:
                      - A string: "GET key"
                      - A list: ["GET", "key"]
+            fire_and_forget: Send all commands wrapped in ``CLIENT REPLY OFF``
+                     so the server returns no replies. Results and per-command
+                     errors are not reported.
                      
         Returns:
             BatchCommandResult with execution details
         """
-        start_time = time.time()
-        results = []
-        successful = 0
+        if fire_and_forget:
+            return self._execute_without_replies(commands)
         
-        for cmd in commands:
-            if isinstance(cmd, str):
-                # Parse string command
-                parts = cmd.split()
-                if not parts:
-                    continue
-                command, args = parts[0], parts[1:]
-            elif isinstance(cmd, list) and cmd:
-                command, args = cmd[0], cmd[1:]
-            else:
-                continue
-            
-            result = self.execute_command(command, *args)
-            results.append(result)
+        start_ns = time.perf_counter_ns()
+        results: List[Optional[CommandResult]] = []
+        # Commands allowed to run, and their positions in results
+        runnable: List[Tuple[str, List[str]]] = []
+        positions: List[int] = []
+        
+        for _, parts in self._normalize_commands(commands):
+            command, args = parts[0], parts[1:]
             
-            if result.success:
-                successful += 1
+            if self._is_dangerous_command(command) and not self.settings.enable_dangerous_commands:
+                # Blocked commands are reported in place without being sent
+                results.append(CommandResult(
+                    command=_format_command(command, args),
+                    success=False,
+                    result=None,
+                    execution_time_ms=0,
+                    error=f"Command '{command}' is blocked for safety. "
+                          f"Enable dangerous commands to use it."
+                ))
+            else:
+                positions.append(len(results))
+                runnable.append((command, args))
+                results.append(None)
+        
+        if runnable:
+            for index, result in zip(positions, self._execute_isolated_pipeline(runnable)):
+                results[index] = result
         
-        total_time = (time.time() - start_time) * 1000
+        successful = sum(1 for result in results if result.success)
+        total_time = _elapsed_ms(start_ns)
         
         return BatchCommandResult(
             total_commands=len(results),
@@ -172,96 +319,349 @@ class CommandExecutor:
             results=results
         )
     
-    def execute_pipeline(self, commands: List[Union[str, List[str]]]) -> BatchCommandResult:
+    def _execute_isolated_pipeline(self, commands: List[Tuple[str, List[str]]]) -> List[CommandResult]:
+        """Send commands in one pipeline, reporting each command's error separately.
+        
+        Args:
+            commands: Parsed ``(command, args)`` pairs, already safety-checked
+            
+        Returns:
+            CommandResult for each command, in order
+        """
+        start_ns = time.perf_counter_ns()
+        client = self.connection_manager.get_client()
+        replies = []
+        
+        for chunk in self._pipeline_chunks(commands):
+            try:
+                pipeline = client.pipeline(transaction=False)
+                for command, args in chunk:
+                    pipeline.execute_command(command, *args)
+                replies.extend(pipeline.execute(raise_on_error=False))
+            except TimeoutError:
+                replies.extend(
+                    [TimeoutError(f"Command timed out after {self.settings.command_timeout}s")] * len(chunk)
+                )
+            except Exception as e:
+                # Nothing came back, so every command in the chunk shares the failure
+                replies.extend([e] * len(chunk))
+        
+        execution_time = _elapsed_ms(start_ns)
+        # Per-command time is the pipeline time averaged over its commands
+        per_command_ms = execution_time / len(commands)
+        logger.info("Executed batch of %d commands (%.2fms)", len(commands), execution_time)
+        
+        results = []
+        for (command, args), reply in zip(commands, replies):
+            full_command = _format_command(command, args)
+            
+            if isinstance(reply, Exception):
+                logger.error("Redis error executing %s: %s", full_command, reply)
+                results.append(CommandResult(
+                    command=full_command,
+                    success=False,
+                    result=None,
+                    execution_time_ms=per_command_ms,
+                    error=str(reply)
+                ))
+            else:
+                results.append(CommandResult(
+                    command=full_command,
+                    success=True,
+                    result=self._format_result(reply, command),
+                    execution_time_ms=per_command_ms,
+                    warning=f"Warning: Executing dangerous command '{command}'"
+                            if self._is_dangerous_command(command) else None
+                ))
+        
+        return results
+    
+    def execute_pipeline(
+        self,
+        commands: List[Union[str, List[str]]],
+        fire_and_forget: bool = False
+    ) -> BatchCommandResult:
         """Execute commands using Redis pipeline for better performance.
         
         Args:
             commands: List of commands to execute in pipeline
+            fire_and_forget: Send the commands with server replies switched
+                     off, as in ``execute_batch_commands``
             
         Returns:
             BatchCommandResult with execution details
         """
-        start_time = time.time()
+        if fire_and_forget:
+            return self._execute_without_replies(commands)
+        
+        start_ns = time.perf_counter_ns()
         client = self.connection_manager.get_client()
+        normalized = self._normalize_commands(commands)
+        
+        rejected = self._reject_pipeline(commands, normalized)
+        if rejected is not None:
+            return rejected
         
+        command_results = []
+        successful = 0
+        
+        # Flush in chunks so neither side buffers an unbounded pipeline; a
+        # failed chunk does not stop the ones after it
+        for chunk in self._pipeline_chunks(normalized):
+            chunk_start_ns = time.perf_counter_ns()
+            
+            try:
+                pipeline = client.pipeline(transaction=False)
+                
+                # Add commands to pipeline
+                for _, parts in chunk:
+                    pipeline.execute_command(*parts)
+                
+                # Execute pipeline
+                results = pipeline.execute()
+                command_results.extend(self._chunk_results(chunk, results, chunk_start_ns))
+                successful += len(chunk)
+                
+            except Exception as e:
+                command_results.extend(self._failed_chunk(chunk, e))
+        
+        return self._pipeline_result(command_results, successful, start_ns)
+    
+    def _reject_pipeline(
+        self,
+        commands: List[Union[str, List[str]]],
+        normalized: List[Tuple[Union[str, List[str]], List[str]]]
+    ) -> Optional[BatchCommandResult]:
+        """Check a whole pipeline before sending any of it.
+        
+        Args:
+            commands: Commands as given
+            normalized: Output of ``_normalize_commands``
+            
+        Returns:
+            A result failing every command, or None if the pipeline may run
+        """
         # Check for dangerous commands first
+        error = None
+        for _, (command_name, *_) in normalized:
+            if self._is_dangerous_command(command_name) and not self.settings.enable_dangerous_commands:
+                error = f"Pipeline contains dangerous command '{command_name}'"
+                break
+        
+        # The server would fail the whole chunk on a malformed command, so
+        # reject it locally instead of spending the round-trip
+        if error is None:
+            for _, parts in normalized:
+                arity_error = self._arity_error(parts)
+                if arity_error is not None:
+                    error = f"Pipeline command rejected: {arity_error}"
+                    break
+        
+        if error is None:
+            return None
+        
+        return BatchCommandResult(
+            total_commands=len(commands),
+            successful_commands=0,
+            failed_commands=len(commands),
+            total_time_ms=0,
+            results=_RejectedResults(commands, error)
+        )
+    
+    def _chunk_results(
+        self,
+        chunk: List[Tuple[Union[str, List[str]], List[str]]],
+        results: List[Any],
+        chunk_start_ns: int
+    ) -> List[CommandResult]:
+        """Format the replies of one executed pipeline chunk."""
+        # Average time per command
+        per_command_ms = _elapsed_ms(chunk_start_ns) / len(chunk)
+        
+        return [
+            CommandResult(
+                command=str(cmd),
+                success=True,
+                result=self._format_result(result, parts[0]),
+                execution_time_ms=per_command_ms
+            )
+            for (cmd, parts), result in zip(chunk, results)
+        ]
+    
+    @staticmethod
+    def _failed_chunk(
+        chunk: List[Tuple[Union[str, List[str]], List[str]]],
+        error: Exception
+    ) -> List[CommandResult]:
+        """Mark every command of a failed pipeline chunk as failed."""
+        error_msg = f"Pipeline execution failed: {str(error)}"
+        logger.error(error_msg)
+        
+        return [
+            CommandResult(
+                command=str(cmd),
+                success=False,
+                result=None,
+                execution_time_ms=0,
+                error=error_msg
+            )
+            for cmd, _ in chunk
+        ]
+    
+    @staticmethod
+    def _pipeline_result(
+        command_results: List[CommandResult],
+        successful: int,
+        start_ns: int
+    ) -> BatchCommandResult:
+        """Summarize the per-command results of a pipeline."""
+        execution_time = _elapsed_ms(start_ns)
+        logger.info("Executed pipeline with %d commands (%.2fms)", len(command_results), execution_time)
+        
+        return BatchCommandResult(
+            total_commands=len(command_results),
+            successful_commands=successful,
+            failed_commands=len(command_results) - successful,
+            total_time_ms=execution_time,
+            results=command_results
+        )
+    
+    def _pipeline_chunks(self, items: List[Any]) -> Iterator[List[Any]]:
+        """Split pipelined commands into chunks of ``pipeline_chunk_size``."""
+        chunk_size = self.settings.pipeline_chunk_size
+        for offset in range(0, len(items), chunk_size):
+            chunk = items[offset:offset + chunk_size]
+            logger.debug("Flushing pipeline chunk of %d commands", len(chunk))
+            yield chunk
+    
+    @staticmethod
+    def _normalize_commands(
+        commands: List[Union[str, List[str]]]
+    ) -> List[Tuple[Union[str, List[str]], List[str]]]:
+        """Split each command once into its parts.
+        
+        Args:
+            commands: Commands given as strings or lists
+            
+        Returns:
+            ``(original command, parts)`` pairs, skipping empty commands
+        """
+        normalized = []
         for cmd in commands:
-            if isinstance(cmd, str):
-                command_name = cmd.split()[0] if cmd.split() else ""
-            elif isinstance(cmd, list) and cmd:
-                command_name = cmd[0]
+            parts = cmd.split() if isinstance(cmd, str) else cmd
+            if parts and isinstance(parts, list):
+                normalized.append((cmd, parts))
+        return normalized
+    
+    def _execute_without_replies(self, commands: List[Union[str, List[str]]]) -> BatchCommandResult:
+        """Write commands in one packet with server replies switched off.
+        
+        The server skips formatting replies between ``CLIENT REPLY OFF`` and
+        ``CLIENT REPLY ON``, so only the final ``OK`` is read back. Cluster
+        clients have no single connection to switch, and servers that refuse
+        ``CLIENT REPLY`` (old versions, ACL denial) fail the probe sent
+        before the first batch; both fall back to a regular pipeline.
+        
+        Errors are unobservable in this mode, so dangerous commands are
+        refused even when enabled, and commands with the wrong number of
+        arguments are rejected locally.
+        
+        Args:
+            commands: List of commands to send
+            
+        Returns:
+            BatchCommandResult with execution details
+        """
+        parsed = []
+        for _, parts in self._normalize_commands(commands):
+            error = None
+            if self._is_dangerous_command(parts[0]):
+                error = f"Batch contains dangerous command '{parts[0]}'"
             else:
-                continue
+                arity_error = self._arity_error(parts)
+                if arity_error is not None:
+                    error = f"Batch command rejected: {arity_error}"
             
-            if self._is_dangerous_command(command_name) and not self.settings.enable_dangerous_commands:
+            if error is not None:
                 return BatchCommandResult(
                     total_commands=len(commands),
                     successful_commands=0,
                     failed_commands=len(commands),
                     total_time_ms=0,
-                    results=[CommandResult(
-                        command=str(cmd),
-                        success=False,
-                        result=None,
-                        execution_time_ms=0,
-                        error=f"Pipeline contains dangerous command '{command_name}'"
-                    ) for cmd in commands]
+                    results=_RejectedResults(commands, error)
                 )
+            parsed.append(parts)
+        
+        if self.settings.redis_mode == RedisMode.CLUSTER or self._has_client_reply is False:
+            return self.execute_pipeline(commands)
         
+        start_ns = time.perf_counter_ns()
+        
+        pool = self.connection_manager.get_client().connection_pool
+        connection = pool.get_connection("CLIENT")
+        written = False
         try:
-            pipeline = client.pipeline()
-            
-            # Add commands to pipeline
-            for cmd in commands:
-                if isinstance(cmd, str):
-                    parts = cmd.split()
-                    if parts:
-                        pipeline.execute_command(parts[0], *parts[1:])
-                elif isinstance(cmd, list) and cmd:
-                    pipeline.execute_command(cmd[0], *cmd[1:])
-            
-            # Execute pipeline
-            results = pipeline.execute()
-            execution_time = (time.time() - start_time) * 1000
-            
-            # Format results
-            command_results = []
-            for i, (cmd, result) in enumerate(zip(commands, results)):
-                formatted_result = self._format_result(result, str(cmd))
-                command_results.append(CommandResult(
-                    command=str(cmd),
-                    success=True,
-                    result=formatted_result,
-                    execution_time_ms=execution_time / len(commands)  # Average time per command
-                ))
-            
-            logger.info(f"Executed pipeline with {len(commands)} commands ({execution_time:.2f}ms)")
-            
-            return BatchCommandResult(
-                total_commands=len(command_results),
-                successful_commands=len(command_results),
-                failed_commands=0,
-                total_time_ms=execution_time,
-                results=command_results
-            )
+            if self._has_client_reply is None:
+                # Probe before writing, while nothing has run yet
+                connection.send_command("CLIENT", "REPLY", "ON")
+                try:
+                    connection.read_response()
+                    self._has_client_reply = True
+                except ResponseError as e:
+                    logger.warning("CLIENT REPLY unavailable, using a regular pipeline: %s", e)
+                    self._has_client_reply = False
             
+            if self._has_client_reply:
+                written = True
+                connection.send_packed_command(connection.pack_commands([
+                    ("CLIENT", "REPLY", "OFF"),
+                    *parsed,
+                    ("CLIENT", "REPLY", "ON"),
+                ]))
+                connection.read_response()
         except Exception as e:
-            error_msg = f"Pipeline execution failed: {str(e)}"
+            # Replies may still be in flight; never hand this connection back
+            connection.disconnect()
+            if written:
+                # The commands may already have run; only the reply was lost
+                error_msg = f"Fire-and-forget batch outcome unknown, commands may have run: {str(e)}"
+            else:
+                error_msg = f"Fire-and-forget batch failed: {str(e)}"
             logger.error(error_msg)
-            
             return BatchCommandResult(
-                total_commands=len(commands),
+                total_commands=len(parsed),
                 successful_commands=0,
-                failed_commands=len(commands),
-                total_time_ms=(time.time() - start_time) * 1000,
+                failed_commands=len(parsed),
+                total_time_ms=_elapsed_ms(start_ns),
                 results=[CommandResult(
-                    command=str(cmd),
+                    command=_format_command(parts[0], parts[1:]),
                     success=False,
                     result=None,
                     execution_time_ms=0,
                     error=error_msg
-                ) for cmd in commands]
+                ) for parts in parsed]
             )
+        finally:
+            pool.release(connection)
+        
+        if not self._has_client_reply:
+            return self.execute_pipeline(commands)
+        
+        execution_time = _elapsed_ms(start_ns)
+        logger.info("Sent %d commands without replies (%.2fms)", len(parsed), execution_time)
+        
+        return BatchCommandResult(
+            total_commands=len(parsed),
+            successful_commands=len(parsed),
+            failed_commands=0,
+            total_time_ms=execution_time,
+            results=[CommandResult(
+                command=_format_command(parts[0], parts[1:]),
+                success=True,
+                result=None,
+                execution_time_ms=execution_time / len(parsed) if parsed else 0
+            ) for parts in parsed]
+        )
     
     def _is_dangerous_command(self, command: str) -> bool:
         """Check if a command is considered dangerous.
@@ -272,7 +672,62 @@ class CommandExecutor:
         Returns:
             True if command is dangerous
         """
-        return command.upper() in [cmd.upper() for cmd in self.settings.dangerous_commands]
+        if self.settings.is_dangerous(command):
+            return True
+        if self.settings.read_only:
+            if not self._get_validation_table():
+                # Fail closed: without the table, writes cannot be told apart
+                logger.warning("Command table unavailable, treating '%s' as a write", command)
+                return True
+            return command.upper() in self._write_commands
+        return False
+    
+    def _get_command_table(self, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Get the cached command table, fetching it on first use or refresh."""
+        if refresh or not self._cmdinfo_cache:
+            self._cmdinfo_cache = self.connection_manager.load_command_table()
+            self._write_commands = frozenset(
+                name for name, info in self._cmdinfo_cache.items() if "write" in info["flags"]
+            )
+        return self._cmdinfo_cache
+    
+    def _get_validation_table(self) -> Dict[str, Dict[str, Any]]:
+        """Get the command table for local checks, or an empty table if unavailable.
+        
+        A refusal from the server (e.g. COMMAND denied by ACL or unknown) is
+        remembered so checks are skipped instead of retried on every call.
+        Connection and timeout errors are not, so the next call retries.
+        """
+        if self._cmdinfo_cache is None:
+            try:
+                self._get_command_table()
+            except ResponseError as e:
+                logger.warning("Command table refused, skipping local validation: %s", e)
+                self._cmdinfo_cache = {}
+            except Exception as e:
+                logger.warning("Command table unavailable, will retry: %s", e)
+                return {}
+        return self._cmdinfo_cache
+    
+    def _arity_error(self, parts: List[str]) -> Optional[str]:
+        """Check a command's argument count against its COMMAND arity.
+        
+        Args:
+            parts: Command name followed by its arguments
+            
+        Returns:
+            The error Redis would reply with, or None if the count is valid
+            or the command is unknown locally
+        """
+        info = self._get_validation_table().get(parts[0].upper())
+        if info is None:
+            return None
+        
+        # Positive arity is exact; negative arity is a minimum
+        arity = info["arity"]
+        if len(parts) == arity or (arity < 0 and len(parts) >= -arity):
+            return None
+        return f"wrong number of arguments for '{parts[0].lower()}' command"
     
     def _format_result(self, result: Any, command: str) -> Any:
         """Format command result for better readability.
@@ -287,78 +742,45 @@ class CommandExecutor:
         if result is None:
             return None
         
-        command_upper = command.upper().split()[0] if command else ""
-        
-        # Handle different result types
-        if isinstance(result, bytes):
-            try:
-                return result.decode('utf-8')
-            except UnicodeDecodeError:
-                return f"<binary data: {len(result)} bytes>"
-        
-        elif isinstance(result, list):
-            # Format list results
-            if command_upper in ["KEYS", "SCAN"]:
-                return result  # Keep as is for key lists
-            elif len(result) > 100:
-                return {
-                    "total_items": len(result),
-                    "sample_items": result[:10],
-                    "truncated": True
-                }
-            else:
-                return result
-        
-        elif isinstance(result, dict):
-            # Format dictionary results (like INFO command)
-            if len(result) > 50:
-                return {
-                    "total_fields": len(result),
-                    "sample_fields": dict(list(result.items())[:10]),
-                    "truncated": True
-                }
-            else:
-                return result
-        
-        elif isinstance(result, str) and len(result) > 1000:
-            # Truncate very long strings
-            return {
-                "length": len(result),
-                "preview": result[:500] + "...",
-                "truncated": True
-            }
-        
-        return result
+        # Dispatch on the exact reply type; integers and the like pass through
+        formatter = _RESULT_FORMATTERS.get(type(result))
+        if formatter is None:
+            return result
+        return formatter(result, command)
     
-    def get_command_info(self, command: str) -> Dict[str, Any]:
+    def get_command_info(self, command: str, refresh: bool = False) -> Dict[str, Any]:
         """Get information about a Redis command.
         
+        The whole command table is fetched with one ``COMMAND`` call and
+        cached, so later lookups need no round-trip.
+        
         Args:
             command: Command name to get info for
+            refresh: Refetch the command table, e.g. after a server upgrade
             
         Returns:
             Dictionary with command information
         """
-        client = self.connection_manager.get_client()
-        
         try:
-            # Get command info from Redis
-            command_info = client.command_info(command)
+            info = self._get_command_table(refresh).get(command.upper())
+            is_dangerous = self._is_dangerous_command(command)
+            blocked = is_dangerous and not self.settings.enable_dangerous_commands
             
             return {
                 "command": command,
-                "exists": command in command_info,
-                "is_dangerous": self._is_dangerous_command(command),
-                "blocked": self._is_dangerous_command(command) and not self.settings.enable_dangerous_commands,
-                "info": command_info.get(command, {}) if command in command_info else None
+                "exists": info is not None,
+                "is_dangerous": is_dangerous,
+                "blocked": blocked,
+                "info": info
             }
             
         except Exception as e:
+            is_dangerous = self.settings.is_dangerous(command)
             return {
                 "command": command,
                 "exists": None,
-                "is_dangerous": self._is_dangerous_command(command),
-                "blocked": self._is_dangerous_command(command) and not self.settings.enable_dangerous_commands,
+                "is_dangerous": is_dangerous,
+                "blocked": is_dangerous and not self.settings.enable_dangerous_commands,
                 "error": str(e)
             }
     
@@ -369,7 +791,7 @@ class CommandExecutor:
             Dictionary with dangerous commands information
         """
         return {
-            "dangerous_commands": self.settings.dangerous_commands,
+            "dangerous_commands": sorted(self.settings.dangerous_commands),
             "enabled": self.settings.enable_dangerous_commands,
             "blocked_count": len(self.settings.dangerous_commands) if not self.settings.enable_dangerous_commands else 0
         }
\ No newline at end of file
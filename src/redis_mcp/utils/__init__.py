@@ -1,5 +1,5 @@
 """Utility functions for Redis MCP."""
 
-from .helpers import format_bytes, format_duration, safe_json_serialize
+from .helpers import format_bytes, format_bytes_bulk, format_duration, safe_json_serialize
 
-__all__ = ["format_bytes", "format_duration", "safe_json_serialize"]
\ No newline at end of file
+__all__ = ["format_bytes", "format_bytes_bulk", "format_duration", "safe_json_serialize"]
\ No newline at end of file
@@ -1,13 +1,25 @@
 """Helper utilities for Redis MCP."""
 
-import json
-from typing import Any
-from datetime import datetime, timedelta
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from math import isfinite
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 
+# Units for format_bytes and the divisor for each
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_POW1024 = tuple(1024.0 ** i for i in range(len(_SIZE_UNITS)))
+_MAX_UNIT_INDEX = len(_SIZE_UNITS) - 1
+
+
+@lru_cache(maxsize=2048)
 def format_bytes(bytes_size: int) -> str:
     """Format bytes into human readable format.
     
+    Reports repeat the same sizes often and the result is an immutable
+    string, so results are memoized.
+    
     Args:
         bytes_size: Size in bytes
         
@@ -17,20 +29,33 @@ def format_bytes(bytes_size: int) -> str:
     if bytes_size == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB", "PB"]
-    size = float(bytes_size)
+    # Every unit is 2**10 times the previous one, so the bit length picks it
     i = 0
+    if bytes_size >= 1:
+        i = min((int(bytes_size).bit_length() - 1) // 10, _MAX_UNIT_INDEX)
     
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
+    return f"{bytes_size / _POW1024[i]:.1f} {_SIZE_UNITS[i]}"
+
+
+def format_bytes_bulk(sizes: Iterable[int]) -> List[str]:
+    """Format a column of byte sizes, such as a key report's sizes.
     
-    return f"{size:.1f} {size_names[i]}"
+    Args:
+        sizes: Sizes in bytes
+        
+    Returns:
+        Formatted string for each size, in input order
+    """
+    return [format_bytes(size) for size in sizes]
 
 
+@lru_cache(maxsize=1024)
 def format_duration(seconds: float) -> str:
     """Format duration in seconds into human readable format.
     
+    Memoized like ``format_bytes``; repeats are mostly whole-second values
+    such as TTLs and uptimes.
+    
     Args:
         seconds: Duration in seconds
         
@@ -39,16 +64,16 @@ def format_duration(seconds: float) -> str:
     """
     if seconds < 1:
         return f"{seconds * 1000:.1f}ms"
-    elif seconds < 60:
+    if seconds < 60:
         return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = int(seconds // 60)
-        remaining_seconds = seconds % 60
-        return f"{minutes}m {remaining_seconds:.1f}s"
-    else:
-        hours = int(seconds // 3600)
-        remaining_minutes = int((seconds % 3600) // 60)
-        return f"{hours}h {remaining_minutes}m"
+    
+    # One divmod per tier; whole-second inputs such as TTLs stay integers
+    minutes, remaining_seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{int(minutes)}m {remaining_seconds:.1f}s"
+    
+    hours, remaining_minutes = divmod(int(minutes), 60)
+    return f"{hours}h {remaining_minutes}m"
 
 
 def safe_json_serialize(obj: Any) -> Any:
@@ -60,22 +85,135 @@ def safe_json_serialize(obj: Any) -> Any:
     Returns:
         JSON-compatible object
     """
-    if obj is None:
-        return None
-    elif isinstance(obj, (bool, int, float, str)):
-        return obj
-    elif isinstance(obj, bytes):
-        try:
-            return obj.decode('utf-8')
-        except UnicodeDecodeError:
-            return f"<binary data: {len(obj)} bytes>"
-    elif isinstance(obj, (list, tuple)):
-        return [safe_json_serialize(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {str(k): safe_json_serialize(v) for k, v in obj.items()}
-    elif isinstance(obj, set):
-        return list(obj)
-    elif hasattr(obj, '__dict__'):
-        return safe_json_serialize(obj.__dict__)
+    return _to_json_compatible(obj)
+
+
+# Nesting depth at which conversion gives up, e.g. on self-referencing objects
+MAX_NESTING_DEPTH = 10000
+
+# Element types a sequence may hold to be copied without per-item conversion
+_PRIMITIVE_TYPES = frozenset({str, int, bool})
+
+# Work item for _to_json_compatible: convert value into parent[slot] at a depth
+_Push = Callable[[Tuple[Any, Any, Any, int]], None]
+
+
+def _child_depth(depth: int) -> int:
+    """Depth of the values nested one level below ``depth``."""
+    if depth >= MAX_NESTING_DEPTH:
+        raise ValueError(f"Value nested deeper than {MAX_NESTING_DEPTH} levels")
+    return depth + 1
+
+
+def _convert_scalar(value: Any, parent: Any, slot: Any, depth: int, push: _Push) -> None:
+    parent[slot] = value
+
+
+def _convert_float(value: float, parent: Any, slot: Any, depth: int, push: _Push) -> None:
+    # JSON has no NaN or infinity
+    parent[slot] = value if isfinite(value) else None
+
+
+def _convert_bytes(value: bytes, parent: Any, slot: Any, depth: int, push: _Push) -> None:
+    # Most Redis strings are ASCII; the scan is cheaper than a failed decode
+    if value.isascii():
+        parent[slot] = value.decode('ascii')
+        return
+    try:
+        parent[slot] = value.decode('utf-8')
+    except UnicodeDecodeError:
+        parent[slot] = f"<binary data: {len(value)} bytes>"
+
+
+def _convert_sequence(value: Any, parent: Any, slot: Any, depth: int, push: _Push) -> None:
+    # Replies such as SMEMBERS or LRANGE usually hold one primitive type and
+    # can be copied as-is instead of converting each member
+    if value:
+        kind = type(next(iter(value)))
+        if kind in _PRIMITIVE_TYPES and all(type(item) is kind for item in value):
+            parent[slot] = list(value)
+            return
+    
+    depth = _child_depth(depth)
+    out = [None] * len(value)
+    parent[slot] = out
+    for index, item in enumerate(value):
+        push((item, out, index, depth))
+
+
+def _convert_dict(value: dict, parent: Any, slot: Any, depth: int, push: _Push) -> None:
+    depth = _child_depth(depth)
+    # Keys are placed up front to keep their order; children are pushed in
+    # reverse so that the last of several keys with the same str() wins
+    # Redis field names are almost always exact str, so skip the cast for them
+    keys = [key if type(key) is str else str(key) for key in value]
+    out = dict.fromkeys(keys)
+    parent[slot] = out
+    for key, item in zip(reversed(keys), reversed(value.values())):
+        push((item, out, key, depth))
+
+
+def _convert_other(value: Any, parent: Any, slot: Any, depth: int, push: _Push) -> None:
+    """Convert values whose exact type has no entry in _CONVERTERS."""
+    if isinstance(value, float):
+        _convert_float(value, parent, slot, depth, push)
+    elif isinstance(value, (bool, int, str)):
+        # Subclasses such as IntEnum members
+        parent[slot] = value
+    elif isinstance(value, bytes):
+        _convert_bytes(value, parent, slot, depth, push)
+    elif isinstance(value, (list, tuple, set, frozenset, Sequence)):
+        # Includes lazy sequences such as rejected batch results
+        _convert_sequence(value, parent, slot, depth, push)
+    elif isinstance(value, dict):
+        _convert_dict(value, parent, slot, depth, push)
+    elif is_dataclass(value) and not isinstance(value, type):
+        # Slotted dataclasses have no __dict__
+        depth = _child_depth(depth)
+        names = [f.name for f in fields(value)]
+        out = dict.fromkeys(names)
+        parent[slot] = out
+        for name in names:
+            push((getattr(value, name), out, name, depth))
+    elif hasattr(value, '__dict__'):
+        push((value.__dict__, parent, slot, _child_depth(depth)))
     else:
-        return str(obj)
\ No newline at end of file
+        parent[slot] = str(value)
+
+
+# Converter for each exact type, so common values cost one dict lookup
+_CONVERTERS: Dict[type, Callable[[Any, Any, Any, int, _Push], None]] = {
+    type(None): _convert_scalar,
+    bool: _convert_scalar,
+    int: _convert_scalar,
+    float: _convert_float,
+    str: _convert_scalar,
+    bytes: _convert_bytes,
+    list: _convert_sequence,
+    tuple: _convert_sequence,
+    set: _convert_sequence,
+    frozenset: _convert_sequence,
+    dict: _convert_dict,
+}
+
+
+def _to_json_compatible(obj: Any) -> Any:
+    """Convert an object and everything nested in it to JSON-compatible values.
+    
+    Walks the value with an explicit stack instead of recursing, so deeply
+    nested replies cost no Python frames and cannot hit the recursion limit.
+    
+    Raises:
+        ValueError: If the value is nested deeper than MAX_NESTING_DEPTH
+    """
+    root = [None]
+    stack = [(obj, root, 0, 0)]
+    pop = stack.pop
+    push = stack.append
+    converters = _CONVERTERS
+    
+    while stack:
+        value, parent, slot, depth = pop()
+        converters.get(type(value), _convert_other)(value, parent, slot, depth, push)
+    
+    return root[0]
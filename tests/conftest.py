@@ -1,17 +1,39 @@
 """Test configuration and fixtures for Redis MCP tests."""
 
+from copy import deepcopy
+from types import MappingProxyType
+
 import pytest
 from unittest.mock import Mock
-import os
 
 from redis_mcp.config.settings import RedisSettings, RedisMode
 from redis_mcp.connection.manager import RedisConnectionManager
 
 
-@pytest.fixture
+# Environment variables cleared around every test
+REDIS_ENV_VARS = frozenset({
+    "REDIS_URL", "REDIS_HOST", "REDIS_PORT", "REDIS_DB", "REDIS_PASSWORD",
+    "REDIS_MODE", "REDIS_CLUSTER_NODES", "REDIS_SENTINEL_HOSTS",
+    "LARGE_KEY_THRESHOLD", "ENABLE_DANGEROUS_COMMANDS"
+})
+
+
+def _settings_without_env(**kwargs) -> RedisSettings:
+    """Build settings that ignore the Redis variables of the calling environment."""
+    with pytest.MonkeyPatch.context() as mp:
+        for var in REDIS_ENV_VARS:
+            mp.delenv(var, raising=False)
+        return RedisSettings(**kwargs)
+
+
+@pytest.fixture(scope="session")
 def test_settings():
-    """Provide test Redis settings."""
-    return RedisSettings(
+    """Provide test Redis settings.
+    
+    Shared by the whole session; tests needing different values should use
+    ``test_settings.model_copy(update={...})`` instead of mutating it.
+    """
+    return _settings_without_env(
         redis_host="localhost",
         redis_port=6379,
         redis_db=0,
@@ -21,40 +43,60 @@ def test_settings():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cluster_settings():
-    """Provide test Redis cluster settings."""
-    return RedisSettings(
+    """Provide test Redis cluster settings, shared like ``test_settings``."""
+    return _settings_without_env(
         redis_mode=RedisMode.CLUSTER,
         redis_cluster_nodes=["node1:7000", "node2:7001", "node3:7002"],
         large_key_threshold=1000
     )
 
 
+# Dangerous commands, as sample command lines
+DANGEROUS_COMMANDS = frozenset({
+    "FLUSHDB",
+    "FLUSHALL",
+    "SHUTDOWN",
+    "CONFIG SET",
+    "EVAL 'redis.call(\"flushall\")' 0"
+})
+
+# INFO reply of the mock Redis client
+INFO_RESPONSE = {
+    "redis_version": "6.2.0",
+    "used_memory": 1024000,
+    "connected_clients": 1,
+    "total_commands_processed": 1000,
+    "role": "master",
+    "tcp_port": 6379,
+    "uptime_in_seconds": 3600,
+    "keyspace": {"db0": {"keys": 10, "expires": 2}}
+}
+
+# Replies of the mock Redis client; deep-copied into every test so nested
+# values (the INFO keyspace, SCAN key lists) are never shared
+MOCK_REDIS_RETURNS = {
+    "ping": True,
+    "info": INFO_RESPONSE,
+    "dbsize": 10,
+    "execute_command": "OK",
+    "type": "string",
+    "ttl": -1,
+    "strlen": 100,
+    "scan": (0, ["key1", "key2", "key3"]),
+    "memory_usage": 128,
+}
+
+
 @pytest.fixture
 def mock_redis_client():
-    """Mock Redis client with common methods."""
+    """Mock Redis client with common methods, built fresh for every test."""
     mock_client = Mock()
     
     # Mock common Redis responses
-    mock_client.ping.return_value = True
-    mock_client.info.return_value = {
-        "redis_version": "6.2.0",
-        "used_memory": 1024000,
-        "connected_clients": 1,
-        "total_commands_processed": 1000,
-        "role": "master",
-        "tcp_port": 6379,
-        "uptime_in_seconds": 3600,
-        "keyspace": {"db0": {"keys": 10, "expires": 2}}
-    }
-    mock_client.dbsize.return_value = 10
-    mock_client.execute_command.return_value = "OK"
-    mock_client.type.return_value = "string"
-    mock_client.ttl.return_value = -1
-    mock_client.strlen.return_value = 100
-    mock_client.scan.return_value = (0, ["key1", "key2", "key3"])
-    mock_client.memory_usage.return_value = 128
+    for name, value in deepcopy(MOCK_REDIS_RETURNS).items():
+        getattr(mock_client, name).return_value = value
     
     return mock_client
 
@@ -68,58 +110,41 @@ def connection_manager(test_settings, mock_redis_client):
 
 
 @pytest.fixture(autouse=True)
-def clean_environment():
-    """Clean environment variables before and after each test."""
-    # Store original environment
-    original_env = dict(os.environ)
-    
-    # Clean Redis-related environment variables
-    redis_env_vars = [
-        "REDIS_URL", "REDIS_HOST", "REDIS_PORT", "REDIS_DB", "REDIS_PASSWORD",
-        "REDIS_MODE", "REDIS_CLUSTER_NODES", "REDIS_SENTINEL_HOSTS",
-        "LARGE_KEY_THRESHOLD", "ENABLE_DANGEROUS_COMMANDS"
-    ]
-    
-    for var in redis_env_vars:
-        os.environ.pop(var, None)
+def clean_environment(monkeypatch):
+    """Unset Redis-related environment variables for the duration of each test."""
+    for var in REDIS_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
     
     yield
-    
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_large_keys():
-    """Provide sample large key data for testing."""
-    return [
-        {"key": "large_string", "type": "string", "size": 2000, "ttl": None},
-        {"key": "large_list", "type": "list", "size": 1500, "ttl": 3600},
-        {"key": "large_hash", "type": "hash", "size": 5000, "ttl": None},
-        {"key": "small_key", "type": "string", "size": 100, "ttl": None}  # Below threshold
-    ]
+    """Provide sample large key data for testing.
+    
+    Shared read-only views; copy an entry with ``dict(...)`` to change it.
+    """
+    return (
+        MappingProxyType({"key": "large_string", "type": "string", "size": 2000, "ttl": None}),
+        MappingProxyType({"key": "large_list", "type": "list", "size": 1500, "ttl": 3600}),
+        MappingProxyType({"key": "large_hash", "type": "hash", "size": 5000, "ttl": None}),
+        MappingProxyType({"key": "small_key", "type": "string", "size": 100, "ttl": None})  # Below threshold
+    )
 
 
-@pytest.fixture 
+@pytest.fixture(scope="session")
 def sample_redis_commands():
     """Provide sample Redis commands for testing."""
-    return [
+    return (
         "GET test_key",
-        "SET test_key test_value", 
+        "SET test_key test_value",
         "INCR counter",
         "LPUSH mylist item1",
         "SADD myset member1"
-    ]
+    )
 
 
 @pytest.fixture
 def dangerous_commands():
-    """Provide list of dangerous Redis commands."""
-    return [
-        "FLUSHDB",
-        "FLUSHALL", 
-        "SHUTDOWN",
-        "CONFIG SET",
-        "EVAL 'redis.call(\"flushall\")' 0"
-    ]
\ No newline at end of file
+    """Provide the set of dangerous Redis commands."""
+    return DANGEROUS_COMMANDS
\ No newline at end of file
@@ -1,12 +1,29 @@
 """Integration tests for Redis connection management."""
 
+import socket
+
 import pytest
-from unittest.mock import Mock, patch
+import redis
+from unittest.mock import MagicMock, Mock, patch
 
 from redis_mcp.config.settings import RedisSettings, RedisMode
 from redis_mcp.connection.manager import RedisConnectionManager
 
 
+@pytest.fixture(scope="class")
+def _redis_class():
+    """Patch redis.Redis once for every test in a class."""
+    with patch('redis.Redis') as redis_class:
+        yield redis_class
+
+
+@pytest.fixture(scope="class")
+def _redis_cluster_class():
+    """Patch redis.RedisCluster once for every test in a class."""
+    with patch('redis.RedisCluster') as redis_cluster_class:
+        yield redis_cluster_class
+
+
 class TestRedisConnectionIntegration:
     """Integration tests for Redis connection management."""
     
@@ -23,61 +40,82 @@ class TestRedisConnectionIntegration:
         }
         return mock_client
     
-    def test_single_connection_success(self, mock_redis_client):
+    @pytest.fixture
+    def patched_redis(self, _redis_class, mock_redis_client):
+        """Patched redis.Redis, reset for each test, building mock_redis_client."""
+        _redis_class.reset_mock(return_value=True, side_effect=True)
+        _redis_class.return_value = mock_redis_client
+        return _redis_class
+    
+    @pytest.fixture
+    def patched_redis_cluster(self, _redis_cluster_class):
+        """Patched redis.RedisCluster, reset for each test."""
+        _redis_cluster_class.reset_mock(return_value=True, side_effect=True)
+        return _redis_cluster_class
+    
+    def test_single_connection_success(self, patched_redis, mock_redis_client):
         """Test successful single Redis connection."""
         settings = RedisSettings(redis_mode=RedisMode.SINGLE)
         manager = RedisConnectionManager(settings)
         
-        with patch('redis.Redis', return_value=mock_redis_client):
-            client = manager.connect()
-            
-            assert client == mock_redis_client
-            assert manager.is_connected()
-            mock_redis_client.ping.assert_called_once()
+        client = manager.connect()
+        
+        assert client == mock_redis_client
+        assert manager.is_connected()
+        mock_redis_client.ping.assert_called_once()
+    
+    def test_is_connected_pings_after_liveness_window(self, patched_redis, mock_redis_client):
+        """Test that is_connected only pings once the last success is stale."""
+        settings = RedisSettings(redis_mode=RedisMode.SINGLE)
+        manager = RedisConnectionManager(settings)
+        
+        manager.connect()
+        manager._last_ok_ts -= settings.redis_health_check_interval
+        
+        assert manager.is_connected()
+        assert manager.is_connected()
+        assert mock_redis_client.ping.call_count == 2
     
-    def test_connection_failure_handling(self):
+    def test_connection_failure_handling(self, patched_redis):
         """Test connection failure handling."""
         settings = RedisSettings(redis_mode=RedisMode.SINGLE)
         manager = RedisConnectionManager(settings)
         
-        with patch('redis.Redis') as mock_redis_class:
-            mock_redis_class.return_value.ping.side_effect = Exception("Connection failed")
-            
-            with pytest.raises(Exception) as exc_info:
-                manager.connect()
-            
-            assert "Redis connection failed" in str(exc_info.value)
+        patched_redis.return_value.ping.side_effect = Exception("Connection failed")
+        
+        with pytest.raises(Exception) as exc_info:
+            manager.connect()
+        
+        assert "Redis connection failed" in str(exc_info.value)
     
-    def test_get_info_success(self, mock_redis_client):
+    def test_get_info_success(self, patched_redis, mock_redis_client):
         """Test getting Redis info successfully."""
         settings = RedisSettings(redis_mode=RedisMode.SINGLE)
         manager = RedisConnectionManager(settings)
         
-        with patch('redis.Redis', return_value=mock_redis_client):
-            manager.connect()
-            info = manager.get_info()
-            
-            assert "connection_mode" in info
-            assert "current_database" in info
-            assert info["connection_mode"] == "single"
-            mock_redis_client.info.assert_called_once()
-    
-    def test_database_switching_single_mode(self, mock_redis_client):
+        manager.connect()
+        info = manager.get_info()
+        
+        assert "connection_mode" in info
+        assert "current_database" in info
+        assert info["connection_mode"] == "single"
+        mock_redis_client.info.assert_called_once()
+    
+    def test_database_switching_single_mode(self, patched_redis, mock_redis_client):
         """Test database switching in single mode."""
         settings = RedisSettings(redis_mode=RedisMode.SINGLE)
         manager = RedisConnectionManager(settings)
         
-        with patch('redis.Redis', return_value=mock_redis_client):
-            manager.connect()
-            
-            # Mock successful SELECT command
-            mock_redis_client.execute_command.return_value = "OK"
-            
-            success = manager.switch_database(1)
-            
-            assert success is True
-            assert manager.get_current_database() == 1
-            mock_redis_client.execute_command.assert_called_with("SELECT", 1)
+        manager.connect()
+        
+        # Mock successful SELECT command
+        mock_redis_client.execute_command.return_value = "OK"
+        
+        success = manager.switch_database(1)
+        
+        assert success is True
+        assert manager.get_current_database() == 1
+        mock_redis_client.execute_command.assert_called_with("SELECT", 1)
     
     def test_database_switching_cluster_mode_fails(self, mock_redis_client):
         """Test that database switching fails in cluster mode."""
@@ -89,23 +127,22 @@ class TestRedisConnectionIntegration:
         
         assert "single instance mode" in str(exc_info.value).lower()
     
-    def test_command_execution(self, mock_redis_client):
+    def test_command_execution(self, patched_redis, mock_redis_client):
         """Test command execution through connection manager."""
         settings = RedisSettings(redis_mode=RedisMode.SINGLE)
         manager = RedisConnectionManager(settings)
         
-        with patch('redis.Redis', return_value=mock_redis_client):
-            manager.connect()
-            
-            # Mock command result
-            mock_redis_client.execute_command.return_value = "test_result"
-            
-            result = manager.execute_command("GET", "test_key")
-            
-            assert result == "test_result"
-            mock_redis_client.execute_command.assert_called_with("GET", "test_key")
-    
-    def test_disconnect_cleanup(self, mock_redis_client):
+        manager.connect()
+        
+        # Mock command result
+        mock_redis_client.execute_command.return_value = "test_result"
+        
+        result = manager.execute_command("GET", "test_key")
+        
+        assert result == "test_result"
+        mock_redis_client.execute_command.assert_called_with("GET", "test_key")
+    
+    def test_disconnect_cleanup(self, patched_redis, mock_redis_client):
         """Test proper cleanup on disconnect."""
         settings = RedisSettings(redis_mode=RedisMode.SINGLE)
         manager = RedisConnectionManager(settings)
@@ -114,14 +151,13 @@ class TestRedisConnectionIntegration:
         mock_pool = Mock()
         mock_redis_client.connection_pool = mock_pool
         
-        with patch('redis.Redis', return_value=mock_redis_client):
-            manager.connect()
-            manager.disconnect()
-            
-            mock_pool.disconnect.assert_called_once()
-            assert not manager.is_connected()
+        manager.connect()
+        manager.disconnect()
+        
+        mock_pool.disconnect.assert_called_once()
+        assert not manager.is_connected()
     
-    def test_cluster_connection_setup(self):
+    def test_cluster_connection_setup(self, patched_redis_cluster):
         """Test cluster connection setup with proper parameters."""
         settings = RedisSettings(
             redis_mode=RedisMode.CLUSTER,
@@ -129,18 +165,89 @@ class TestRedisConnectionIntegration:
         )
         manager = RedisConnectionManager(settings)
         
-        mock_cluster_client = Mock()
-        mock_cluster_client.ping.return_value = True
+        patched_redis_cluster.return_value.ping.return_value = True
         
-        with patch('redis.RedisCluster', return_value=mock_cluster_client) as mock_cluster:
-            manager.connect()
-            
-            # Verify cluster client was created with correct startup nodes
-            mock_cluster.assert_called_once()
-            call_args = mock_cluster.call_args
-            startup_nodes = call_args[1]['startup_nodes']
-            
-            assert len(startup_nodes) == 3
-            assert {"host": "node1", "port": 7000} in startup_nodes
-            assert {"host": "node2", "port": 7001} in startup_nodes
-            assert {"host": "node3", "port": 7002} in startup_nodes
\ No newline at end of file
+        manager.connect()
+        
+        # Verify cluster client was created with correct startup nodes
+        patched_redis_cluster.assert_called_once()
+        call_args = patched_redis_cluster.call_args
+        startup_nodes = call_args[1]['startup_nodes']
+        
+        assert len(startup_nodes) == 3
+        assert {"host": "node1", "port": 7000} in startup_nodes
+        assert {"host": "node2", "port": 7001} in startup_nodes
+        assert {"host": "node3", "port": 7002} in startup_nodes
+    
+class TestRedisConnectionPools:
+    """Tests building real, unconnected redis-py clients and pools."""
+    
+    def test_single_connection_from_url(self):
+        """Test that redis_url is handed to Redis.from_url."""
+        settings = RedisSettings(redis_url="unix:///tmp/redis.sock?db=3")
+        manager = RedisConnectionManager(settings)
+        
+        client = manager._create_single_connection()
+        
+        assert client.connection_pool.connection_kwargs["path"] == "/tmp/redis.sock"
+        assert "socket_keepalive" not in client.connection_pool.connection_kwargs
+        assert manager.get_current_database() == 3
+        assert client.connection_pool.connection_class is redis.UnixDomainSocketConnection
+    
+    def test_client_for_db(self):
+        """Test per-database clients reuse the main pool's settings without SELECT."""
+        settings = RedisSettings(redis_url="unix:///tmp/redis.sock?db=3")
+        manager = RedisConnectionManager(settings)
+        manager._client = manager._create_single_connection()
+        
+        other = manager.get_client_for_db(5)
+        current = manager.get_client_for_db(3)
+        
+        assert current is not manager._client
+        assert current.connection_pool.connection_kwargs["db"] == 3
+        assert manager.get_client_for_db(5) is other
+        assert other.connection_pool.connection_kwargs["db"] == 5
+        assert isinstance(other.connection_pool, redis.BlockingConnectionPool)
+        assert other.connection_pool.max_connections == 2
+        assert other.connection_pool.connection_kwargs["path"] == "/tmp/redis.sock"
+        assert other.connection_pool.connection_class is redis.UnixDomainSocketConnection
+        
+        manager.disconnect()
+        assert manager._db_clients == {}
+    
+    def test_client_pins_one_connection(self):
+        """Test client() yields a single-connection client and closes it on exit."""
+        settings = RedisSettings(redis_mode=RedisMode.SINGLE)
+        manager = RedisConnectionManager(settings)
+        manager._client = Mock()
+        pinned = manager._client.client.return_value = MagicMock()
+        
+        with manager.client() as client:
+            assert client is pinned.__enter__.return_value
+        
+        pinned.__exit__.assert_called_once()
+    
+    def test_single_connection_send_buffer(self):
+        """Test TCP connections get the configured send buffer."""
+        settings = RedisSettings(redis_mode=RedisMode.SINGLE, redis_socket_send_buffer=65536)
+        manager = RedisConnectionManager(settings)
+        
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            host, port = server.getsockname()
+            pool = redis.ConnectionPool(
+                host=host,
+                port=port,
+                connection_class=manager._get_connection_class()
+            )
+            sock = pool.make_connection()._connect()
+            try:
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+                assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 65536
+            finally:
+                sock.close()
+    
+    def test_send_buffer_is_opt_in(self):
+        """Test the default keeps the plain connection class and kernel autotuning."""
+        manager = RedisConnectionManager(RedisSettings(redis_mode=RedisMode.SINGLE))
+        
+        assert manager._get_connection_class() is redis.Connection
\ No newline at end of file
@@ -0,0 +1,314 @@
+"""Tests for the large key analyzer."""
+
+from types import SimpleNamespace
+
+import pytest
+from redis.exceptions import RedisError, ResponseError
+
+from redis_mcp.config.settings import RedisSettings, RedisMode
+from redis_mcp.connection.manager import RedisConnectionManager
+from redis_mcp.tools.analyzer import KeyInfo, LargeKeyAnalyzer
+
+
+class FakeRedis:
+    """Minimal in-memory Redis answering the commands the analyzer uses."""
+    
+    def __init__(self, data, scripting=True):
+        self.data = data
+        self.scripting = scripting
+        self.round_trips = 0
+    
+    def _value(self, key):
+        return self.data[key][1]
+    
+    def type(self, key):
+        return self.data[key][0] if key in self.data else "none"
+    
+    def ttl(self, key):
+        return -1 if key in self.data else -2
+    
+    def object(self, subcommand, key):
+        return "raw"
+    
+    def memory_usage(self, key):
+        raise ResponseError("unknown command 'MEMORY'")
+    
+    def get(self, key):
+        return self._value(key)
+    
+    def execute_command(self, *args, **options):
+        assert args[0] == "GETRANGE" and options.get("NEVER_DECODE")
+        key, start, end = args[1:]
+        return self._value(key).encode()[start:end + 1]
+    
+    def lrange(self, key, start, end):
+        return list(self._value(key))[start:end + 1]
+    
+    def srandmember(self, key, number):
+        return list(self._value(key))[:number]
+    
+    def strlen(self, key):
+        return len(self._value(key))
+    
+    llen = scard = zcard = hlen = xlen = strlen
+    
+    def scan_iter(self, match=None, count=None):
+        keys = list(self.data)
+        for i in range(0, len(keys), count):
+            self.round_trips += 1
+            yield from keys[i:i + count]
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def register_script(self, script):
+        return FakeMetadataScript()
+    
+    def key_metadata(self, key, memory_arg):
+        """Stand-in for running KEY_METADATA_SCRIPT."""
+        if not self.scripting:
+            raise ResponseError("NOPERM this user has no permissions to run the 'evalsha' command")
+        if key not in self.data:
+            return ["none"]
+        key_type, value = self.data[key]
+        return [key_type, -1, len(value), "raw", None]
+    
+    def __getattribute__(self, name):
+        # Every direct command is one round-trip
+        attr = object.__getattribute__(self, name)
+        if name not in ("data", "round_trips", "pipeline", "scan_iter", "_value", "scripting", "register_script") and callable(attr):
+            self.round_trips += 1
+        return attr
+
+
+class FakeMetadataScript:
+    """Queues a key_metadata call the way redis-py Scripts queue EVALSHA."""
+    
+    def __call__(self, keys, args, client):
+        return client.key_metadata(keys[0], args[0])
+
+
+class FakePipeline:
+    """Queues commands and replays them against FakeRedis in one round-trip."""
+    
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    def __len__(self):
+        return len(self.commands)
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+    
+    def execute(self, raise_on_error=True):
+        self.client.round_trips += 1
+        results = []
+        for name, args, kwargs in self.commands:
+            try:
+                results.append(getattr(type(self.client), name)(self.client, *args, **kwargs))
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        self.commands = []
+        return results
+
+
+class FakeCluster:
+    """Cluster client whose primaries each hold part of the keyspace."""
+    
+    def __init__(self, shards):
+        self.nodes = {name: FakeRedis(shard) for name, shard in shards.items()}
+    
+    def get_primaries(self):
+        return [SimpleNamespace(name=name) for name in self.nodes]
+    
+    def get_redis_connection(self, node):
+        return self.nodes[node.name]
+
+
+@pytest.fixture
+def fake_client():
+    """Fake Redis holding one large and one small key."""
+    return FakeRedis({
+        "big": ("string", "x" * 2000),
+        "small": ("list", "abc"),
+    })
+
+
+@pytest.fixture
+def analyzer(fake_client):
+    """Analyzer wired to the fake client."""
+    settings = RedisSettings(redis_mode=RedisMode.SINGLE, large_key_threshold=1000)
+    manager = RedisConnectionManager(settings)
+    manager._client = fake_client
+    return LargeKeyAnalyzer(manager, settings)
+
+
+class TestLargeKeyAnalyzer:
+    """Test key analysis and round-trip batching."""
+    
+    def test_key_details(self, analyzer, fake_client):
+        """Test key details take two pipelined round-trips."""
+        details = analyzer.get_key_details("small")
+        
+        assert details["type"] == "list"
+        assert details["length"] == 3
+        assert details["ttl"] is None
+        assert details["encoding"] == "raw"
+        assert details["memory_usage"] is None
+        assert details["sample_values"] == ["a", "b", "c"]
+        assert fake_client.round_trips == 2
+    
+    def test_key_details_set_sample(self, analyzer, fake_client):
+        """Test set samples are a bounded SRANDMEMBER reply."""
+        fake_client.data["tags"] = ("set", "abcdefghijklmnop")
+        
+        details = analyzer.get_key_details("tags")
+        
+        assert details["cardinality"] == 16
+        assert len(details["sample_members"]) == 10
+    
+    def test_unsupported_memory_usage_is_skipped(self, analyzer, fake_client, monkeypatch):
+        """Test MEMORY USAGE is not sent again once the server rejects it."""
+        analyzer.get_key_details("big")
+        assert analyzer._has_memory_usage is False
+        assert analyzer._has_object_encoding is True
+        
+        def fail(self, key):
+            raise AssertionError("MEMORY USAGE sent after being rejected")
+        
+        monkeypatch.setattr(FakeRedis, "memory_usage", fail)
+        details = analyzer.get_key_details("small")
+        
+        assert details["memory_usage"] is None
+        assert details["encoding"] == "raw"
+    
+    def test_key_details_missing_key(self, analyzer):
+        """Test that missing keys are reported as errors."""
+        with pytest.raises(RedisError):
+            analyzer.get_key_details("missing")
+    
+    def test_key_details_string_preview(self, analyzer, fake_client):
+        """Test large string previews are sliced server-side."""
+        fake_client.data["big"] = ("string", "a" + "é" * 1000)
+        
+        details = analyzer.get_key_details("big")
+        
+        assert details["value_preview"] == "a" + "é" * 49
+        assert details["is_large"] is True
+    
+    def test_analyze_large_keys(self, analyzer):
+        """Test large keys are found and summarized by type."""
+        report = analyzer.analyze_large_keys()
+        
+        assert report.total_keys_scanned == 2
+        assert [k.key for k in report.keys] == ["big"]
+        assert report.summary_by_type["string"]["count"] == 1
+    
+    def test_analyze_large_keys_respects_limit(self, analyzer, fake_client):
+        """Test scanning stops after ``limit`` keys across batches."""
+        analyzer.settings.scan_count = 2
+        for i in range(5):
+            fake_client.data[f"key:{i}"] = ("list", "v")
+        
+        report = analyzer.analyze_large_keys(limit=5)
+        
+        assert report.total_keys_scanned == 5
+    
+    def test_analyze_large_keys_batches_round_trips(self, analyzer, fake_client):
+        """Test a SCAN batch costs two pipelines regardless of its size."""
+        for i in range(50):
+            fake_client.data[f"key:{i}"] = ("hash", "v" * i)
+        
+        report = analyzer.analyze_large_keys()
+        
+        assert report.total_keys_scanned == 52
+        assert fake_client.round_trips == 2
+    
+    def test_analyze_large_keys_without_scripting(self, analyzer, fake_client):
+        """Test refused scripting falls back to plain command pipelines."""
+        fake_client.scripting = False
+        
+        first = analyzer.analyze_large_keys()
+        second = analyzer.analyze_large_keys()
+        
+        assert [k.key for k in first.keys] == [k.key for k in second.keys] == ["big"]
+        assert analyzer._use_metadata_script is False
+    
+    def test_script_error_on_one_key_keeps_scripting(self, analyzer, fake_client, monkeypatch):
+        """Test a script failing on one key is reported in place without disabling scripting."""
+        key_metadata = FakeRedis.key_metadata
+        
+        def failing_key_metadata(self, key, memory_arg):
+            if key == "small":
+                raise ResponseError("OOM command not allowed when used memory > 'maxmemory'")
+            return key_metadata(self, key, memory_arg)
+        
+        monkeypatch.setattr(FakeRedis, "key_metadata", failing_key_metadata)
+        
+        results = analyzer._analyze_batch(fake_client, ["small", "big"])
+        
+        assert isinstance(results[0], ResponseError)
+        assert results[1].size == 2000
+        assert analyzer._use_metadata_script is True
+    
+    def test_analyze_batch_reports_missing_keys(self, analyzer, fake_client):
+        """Test that keys deleted mid-scan are returned as errors in place."""
+        results = analyzer._analyze_batch(fake_client, ["small", "gone", "big"])
+        
+        assert results[0].size == 3
+        assert isinstance(results[1], ValueError)
+        assert results[2].size == 2000
+
+    
+    def test_tally_batch_totals_memory(self, analyzer):
+        """Test batch memory totals skip failed keys and unknown usage."""
+        results = [
+            KeyInfo("a", "string", 2000, None, "raw", 2048),
+            ValueError("gone"),
+            KeyInfo("c", "list", 3, None, "raw", None),
+            KeyInfo("d", "hash", 5, None, "raw", 96),
+        ]
+        large_keys = []
+        
+        scanned, memory = analyzer._tally_batch(["a", "b", "c", "d"], results, large_keys)
+        
+        assert (scanned, memory) == (3, 2144)
+        assert [k.key for k in large_keys] == ["a"]
+
+
+class TestLargeKeyAnalyzerCluster:
+    """Test scanning every cluster primary."""
+    
+    @pytest.fixture
+    def cluster_analyzer(self):
+        """Analyzer wired to a fake two-primary cluster."""
+        settings = RedisSettings(
+            redis_mode=RedisMode.CLUSTER,
+            redis_cluster_nodes=["node1:7000"],
+            large_key_threshold=1000
+        )
+        manager = RedisConnectionManager(settings)
+        manager._client = FakeCluster({
+            "node1:7000": {"big": ("string", "x" * 2000), "a": ("set", "ab")},
+            "node2:7001": {"huge": ("hash", "y" * 5000), "b": ("zset", "c")},
+        })
+        return LargeKeyAnalyzer(manager, settings)
+    
+    def test_scans_every_primary(self, cluster_analyzer):
+        """Test keys from all primaries are analyzed."""
+        report = cluster_analyzer.analyze_large_keys()
+        
+        assert report.total_keys_scanned == 4
+        assert [k.key for k in report.top_keys_by_size] == ["huge", "big"]
+    
+    def test_limit_is_shared_across_nodes(self, cluster_analyzer):
+        """Test the key limit caps the total across concurrent node scans."""
+        report = cluster_analyzer.analyze_large_keys(limit=3)
+        
+        assert report.total_keys_scanned == 3
\ No newline at end of file
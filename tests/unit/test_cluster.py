@@ -0,0 +1,251 @@
+"""Tests for Redis cluster management utilities."""
+
+import json
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from redis_mcp.config.settings import RedisSettings, RedisMode
+from redis_mcp.connection.manager import RedisConnectionManager
+from redis_mcp.connection.cluster import RedisClusterManager
+from redis_mcp.connection.crc16 import keyslot, keyslots
+from redis_mcp.utils.helpers import safe_json_serialize
+
+
+CLUSTER_NODES = (
+    "a1 10.0.0.1:7000@17000 myself,master - 0 0 1 connected 0-8191\n"
+    "b1 10.0.0.2:7001@17001 master - 0 1700000000000 2 connected 8192-16383\n"
+    "c1 10.0.0.3:7002@17002 slave a1 0 1700000000000 1 connected\n"
+)
+
+CLUSTER_INFO = (
+    "cluster_state:ok\r\n"
+    "cluster_slots_assigned:16384\r\n"
+    "cluster_known_nodes:3\r\n"
+    "cluster_current_epoch:{epoch}\r\n"
+)
+
+CLUSTER_SLOTS = [
+    [8192, 16383, ["10.0.0.2", 7001, "b1"]],
+    [0, 8191, ["10.0.0.1", 7000, "a1"], ["10.0.0.3", 7002, "c1"]],
+]
+
+
+class TestRedisClusterManager:
+    """Test cluster topology parsing and caching."""
+    
+    @pytest.fixture
+    def cluster_client(self):
+        """Mock cluster client answering CLUSTER subcommands."""
+        client = Mock()
+        client.epoch = 2
+        
+        def execute_command(*args, **kwargs):
+            subcommand = args[1]
+            if subcommand == "NODES":
+                return CLUSTER_NODES
+            if subcommand == "INFO":
+                return CLUSTER_INFO.format(epoch=client.epoch)
+            if subcommand == "SLOTS":
+                return CLUSTER_SLOTS
+            raise AssertionError(f"Unexpected command {args}")
+        
+        client.execute_command.side_effect = execute_command
+        return client
+    
+    @pytest.fixture
+    def cluster_manager(self, cluster_client):
+        """Cluster manager wired to the mock client."""
+        settings = RedisSettings(
+            redis_mode=RedisMode.CLUSTER,
+            redis_cluster_nodes=["node1:7000"],
+            cluster_topology_ttl=60
+        )
+        manager = RedisConnectionManager(settings)
+        manager._client = cluster_client
+        cluster_manager = RedisClusterManager(manager)
+        yield cluster_manager
+        cluster_manager.stop_topology_refresher()
+    
+    @staticmethod
+    def _calls(client, subcommand):
+        return sum(
+            1 for c in client.execute_command.call_args_list if c.args[1] == subcommand
+        )
+    
+    def test_cluster_info_parsing(self, cluster_manager):
+        """Test parsing of CLUSTER NODES and CLUSTER INFO."""
+        info = cluster_manager.get_cluster_info()
+        
+        assert info["total_nodes"] == 3
+        assert info["master_nodes"] == 2
+        assert info["slave_nodes"] == 1
+        assert info["cluster_info"]["cluster_state"] == "ok"
+        assert info["nodes"][2]["master_id"] == "a1"
+        assert info["nodes"][0]["flags"] == ["myself", "master"]
+        assert info["nodes"][0]["slots"] == ["0-8191"]
+        assert info["nodes"][2]["slots"] == []
+    
+    def test_cluster_info_json(self, cluster_manager):
+        """Test cluster info serializes to JSON in a stable order."""
+        decoded = json.loads(json.dumps(safe_json_serialize(cluster_manager.get_cluster_info())))
+        assert decoded["total_nodes"] == 3
+        assert decoded["nodes"][0]["flags"] == ["myself", "master"]
+    
+    def test_cluster_info_is_cached(self, cluster_manager, cluster_client):
+        """Test that repeated calls reuse the cached topology."""
+        cluster_manager.get_cluster_info()
+        cluster_manager.get_cluster_info()
+        cluster_manager.check_cluster_health()
+        
+        assert self._calls(cluster_client, "NODES") == 1
+        assert self._calls(cluster_client, "INFO") == 1
+    
+    def test_cluster_health(self, cluster_manager):
+        """Test health issues derived from the shared snapshot."""
+        health = cluster_manager.check_cluster_health()
+        
+        assert health["healthy"] is True
+        assert health["master_nodes"] == 2
+        assert health["issues"] == [{
+            "type": "masters_without_slaves",
+            "count": 1,
+            "nodes": ["10.0.0.2:7001@17001"]
+        }]
+    
+    def test_node_keys_count(self, cluster_manager, cluster_client):
+        """Test DBSIZE is collected from every primary."""
+        primaries = [Mock(), Mock()]
+        primaries[0].name, primaries[1].name = "10.0.0.1:7000", "10.0.0.2:7001"
+        node_clients = {p.name: Mock() for p in primaries}
+        node_clients["10.0.0.1:7000"].dbsize.return_value = 42
+        node_clients["10.0.0.2:7001"].dbsize.side_effect = ConnectionError("down")
+        cluster_client.get_primaries.return_value = primaries
+        cluster_client.get_redis_connection.side_effect = lambda node: node_clients[node.name]
+        
+        key_counts = cluster_manager.get_node_keys_count()
+        
+        assert key_counts == {"10.0.0.1:7000": 42, "10.0.0.2:7001": -1}
+    
+    def test_node_keys_count_is_bounded_by_timeout(self, cluster_manager, cluster_client):
+        """Test a hanging primary does not hold the call past the command timeout."""
+        release = threading.Event()
+        primary = Mock()
+        primary.name = "10.0.0.1:7000"
+        cluster_client.get_primaries.return_value = [primary]
+        cluster_client.get_redis_connection.return_value.dbsize.side_effect = lambda: release.wait(5)
+        cluster_manager.connection_manager.command_timeout = 0.05
+        
+        start = time.monotonic()
+        try:
+            key_counts = cluster_manager.get_node_keys_count()
+        finally:
+            release.set()
+        
+        assert key_counts == {"10.0.0.1:7000": -1}
+        assert time.monotonic() - start < 1
+    
+    def test_zero_ttl_disables_cache(self, cluster_manager, cluster_client):
+        """Test that a zero TTL always refetches."""
+        cluster_manager.connection_manager.settings.cluster_topology_ttl = 0
+        
+        cluster_manager.get_cluster_slots()
+        cluster_manager.get_cluster_slots()
+        
+        assert self._calls(cluster_client, "SLOTS") == 2
+    
+    def test_epoch_change_invalidates_cache(self, cluster_manager, cluster_client):
+        """Test that a new cluster epoch drops cached slots."""
+        cluster_manager.get_cluster_info()
+        cluster_manager.get_cluster_slots()
+        
+        cluster_client.epoch = 3
+        cluster_manager._cluster_cache["snapshot"]["expiry"] = 0
+        cluster_manager.get_cluster_info()
+        cluster_manager.get_cluster_slots()
+        
+        assert self._calls(cluster_client, "SLOTS") == 2
+    
+    def test_key_node_mapping(self, cluster_manager):
+        """Test resolving the node that owns a key's slot."""
+        mapping = cluster_manager.get_key_node_mapping("foo")
+        
+        assert mapping["slot"] == 12182
+        assert mapping["master_node"]["port"] == 7001
+        assert mapping["replica_nodes"] == []
+    
+    def test_key_node_mapping_batch(self, cluster_manager, cluster_client):
+        """Test resolving several keys against a single slot table build."""
+        mappings = cluster_manager.get_key_node_mapping_batch(["hello", "bar", "foo"])
+        
+        assert [m["master_node"]["port"] for m in mappings] == [7000, 7000, 7001]
+        assert mappings[0]["replica_nodes"][0]["id"] == "c1"
+        assert self._calls(cluster_client, "SLOTS") == 1
+    
+    def test_unassigned_slot_returns_none(self, cluster_manager, cluster_client):
+        """Test that keys hashing to unassigned slots have no mapping."""
+        cluster_client.execute_command.side_effect = lambda *args, **kwargs: CLUSTER_SLOTS[:1]
+        
+        assert cluster_manager.get_key_node_mapping("bar") is None
+    
+    def test_topology_refresher(self, cluster_manager, cluster_client):
+        """Test the background refresher polls a random node until disconnect."""
+        cluster_manager.connection_manager.settings.cluster_topology_ttl = 0.02
+        cluster_manager.get_cluster_info()
+        refresher = cluster_manager._refresher
+        assert refresher is not None and refresher.daemon
+        
+        deadline = time.monotonic() + 2
+        while self._calls(cluster_client, "SLOTS") < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert self._calls(cluster_client, "SLOTS") >= 2
+        assert "target_nodes" in cluster_client.execute_command.call_args.kwargs
+        
+        cluster_manager.connection_manager.disconnect()
+        refresher.join(timeout=1)
+        assert not refresher.is_alive()
+        assert cluster_manager._refresher is None
+    
+    def test_topology_refresher_stops_when_idle(self, cluster_manager, cluster_client):
+        """Test the refresher targets healthy primaries and exits without reads."""
+        cluster_manager.connection_manager.settings.cluster_topology_ttl = 0.02
+        cluster_manager.get_cluster_info()
+        refresher = cluster_manager._refresher
+        
+        refresher.join(timeout=2)
+        
+        assert not refresher.is_alive()
+        assert cluster_manager._refresher is None
+        hosts = {c.kwargs["host"] for c in cluster_client.get_node.call_args_list}
+        assert hosts and hosts <= {"10.0.0.1", "10.0.0.2"}
+
+
+class TestKeyslot:
+    """Test client-side hash slot computation."""
+    
+    @pytest.mark.parametrize("key,slot", [
+        ("foo", 12182),
+        ("bar", 5061),
+        (b"hello", 866),
+        ("", 0),
+    ])
+    def test_known_slots(self, key, slot):
+        """Test slots match the values Redis computes."""
+        assert keyslot(key) == slot
+    
+    def test_hash_tags(self):
+        """Test that only the first non-empty hash tag is hashed."""
+        assert keyslot("{user1000}.following") == keyslot("user1000")
+        assert keyslot("foo{bar}{zap}") == keyslot("bar")
+        assert keyslot("foo{{bar}}zap") == keyslot("{bar")
+        assert keyslot("foo{}{bar}") == keyslot("foo{}{bar}".encode())
+        assert keyslot("{}") == 15257
+    
+    def test_batch_matches_single(self):
+        """Test the batch variant agrees with keyslot()."""
+        keys = ["foo", b"hello", "{user1000}.following", "foo{}{bar}", ""]
+        
+        assert keyslots(keys) == [keyslot(key) for key in keys]
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""Tests for the database switcher."""
+
+import pytest
+from redis.exceptions import ResponseError
+
+from redis_mcp.config.settings import RedisSettings, RedisMode
+from redis_mcp.connection.manager import RedisConnectionManager
+from redis_mcp.tools.database import DatabaseSwitcher
+
+
+class FakeRedis:
+    """Multi-database fake that records every round-trip."""
+    
+    def __init__(self, databases):
+        self.databases = databases
+        self.db = 0
+        self.round_trips = 0
+        # Emulate a pre-4.0 server without FLUSHDB ASYNC
+        self.legacy = False
+        self.pinned = 0
+        # Emulate INFO being denied by an ACL
+        self.info_denied = False
+    
+    def execute_command(self, *args):
+        self.round_trips += 1
+        return self._execute(args)
+    
+    def _execute(self, args):
+        if args[0] == "SELECT":
+            if args[1] >= len(self.databases):
+                raise ResponseError("DB index is out of range")
+            self.db = args[1]
+            return True
+        raise AssertionError(f"Unexpected command {args}")
+    
+    def dbsize(self):
+        self.round_trips += 1
+        return len(self.databases[self.db])
+    
+    def scan(self, cursor=0, count=10):
+        self.round_trips += 1
+        keys = list(self.databases[self.db])
+        end = cursor + count
+        return (end if end < len(keys) else 0), keys[cursor:end]
+    
+    def ttl(self, key):
+        self.round_trips += 1
+        return self._ttl(key)
+    
+    def _ttl(self, key):
+        return self.databases[self.db][key]
+    
+    def flushdb(self, asynchronous=False):
+        self.round_trips += 1
+        if asynchronous and self.legacy:
+            raise ResponseError("syntax error")
+        self.databases[self.db].clear()
+        return True
+    
+    def info(self, section=None):
+        self.round_trips += 1
+        if self.info_denied:
+            raise ResponseError("NOPERM this user has no permissions to run the 'info' command")
+        info = {"used_memory": 1024}
+        for db_num, keys in enumerate(self.databases):
+            if keys:
+                expires = sum(1 for ttl in keys.values() if ttl > 0)
+                info[f"db{db_num}"] = {"keys": len(keys), "expires": expires, "avg_ttl": 0}
+        return info
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def client(self):
+        # Stands in for a client pinned to one pooled connection
+        self.pinned += 1
+        return self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.pinned -= 1
+
+
+class FakePipeline:
+    """Replays queued commands against FakeRedis in one round-trip."""
+    
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    def execute_command(self, *args):
+        self.commands.append(args)
+        return self
+    
+    def dbsize(self):
+        return self.execute_command("DBSIZE")
+    
+    def ttl(self, key):
+        return self.execute_command("TTL", key)
+    
+    def execute(self, raise_on_error=True):
+        self.client.round_trips += 1
+        results = []
+        for args in self.commands:
+            try:
+                if args[0] == "DBSIZE":
+                    results.append(len(self.client.databases[self.client.db]))
+                elif args[0] == "TTL":
+                    results.append(self.client._ttl(args[1]))
+                else:
+                    results.append(self.client._execute(args))
+            except ResponseError as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        return results
+
+
+@pytest.fixture
+def fake_client():
+    """Fake server with three databases."""
+    return FakeRedis([{"a": 100, "b": -1}, {}, {"c": 5}])
+
+
+@pytest.fixture
+def switcher(fake_client, monkeypatch):
+    """Database switcher wired to the fake client."""
+    def get_client_for_db(manager, db):
+        # Stands in for a pool bound to ``db``
+        fake_client.db = db
+        return fake_client
+    
+    monkeypatch.setattr(RedisConnectionManager, "get_client_for_db", get_client_for_db)
+    settings = RedisSettings(redis_mode=RedisMode.SINGLE)
+    manager = RedisConnectionManager(settings)
+    manager._client = fake_client
+    return DatabaseSwitcher(manager, settings)
+
+
+class TestDatabaseSwitcher:
+    """Test database listing and inspection."""
+    
+    def test_list_databases(self, switcher, fake_client):
+        """Test all databases are sized in one pipeline plus one INFO."""
+        databases = switcher.list_databases()
+        
+        assert [(db.db_number, db.key_count) for db in databases] == [(0, 2), (1, 0), (2, 1)]
+        assert databases[0].memory_usage == 1024
+        assert [db.expires_count for db in databases] == [1, 0, 1]
+        assert fake_client.round_trips == 2
+        assert fake_client.db == 0
+    
+    def test_database_info_from_keyspace(self, switcher, fake_client):
+        """Test exact counts come from a single INFO."""
+        info = switcher.get_database_info()
+        
+        assert (info.key_count, info.expires_count, info.memory_usage) == (2, 1, 1024)
+        assert fake_client.round_trips == 1
+    
+    def test_database_info_pipelines_ttls(self, switcher, fake_client):
+        """Test TTLs are sampled with one pipeline per SCAN page without INFO."""
+        fake_client.info_denied = True
+        fake_client.databases[0].update({f"key:{i}": 10 if i % 2 else -1 for i in range(98)})
+        
+        info = switcher.get_database_info()
+        
+        assert info.key_count == 100
+        assert info.expires_count == 50
+        assert fake_client.pinned == 0
+        # DBSIZE, INFO, one SCAN page and its TTL pipeline
+        assert fake_client.round_trips == 4
+    
+    @pytest.mark.parametrize("workers,info_denied", [(1, True), (8, True), (8, False)])
+    def test_summary_samples_non_empty_databases(self, switcher, fake_client, monkeypatch, workers, info_denied):
+        """Test summaries sample non-empty databases only when INFO is unavailable."""
+        switcher.settings.database_probe_workers = workers
+        fake_client.info_denied = info_denied
+        sampled = []
+        
+        def get_client_for_db(manager, db):
+            sampled.append(db)
+            client = FakeRedis(fake_client.databases)
+            client.db = db
+            client.info_denied = info_denied
+            return client
+        
+        monkeypatch.setattr(RedisConnectionManager, "get_client_for_db", get_client_for_db)
+        
+        summary = switcher.get_database_summary()
+        
+        assert sorted(sampled) == ([0, 2] if info_denied else [])
+        assert [db["expires_count"] for db in summary["databases"]] == [1, 0, 1]
+        assert summary["total_keys"] == 3
+    
+    @pytest.mark.parametrize("legacy", [False, True])
+    def test_clear_database(self, switcher, fake_client, legacy):
+        """Test FLUSHDB ASYNC falls back to FLUSHDB on servers without it."""
+        switcher.settings.enable_dangerous_commands = True
+        fake_client.legacy = legacy
+        
+        first = switcher.clear_database(confirm=True)
+        second = switcher.clear_database(confirm=True)
+        
+        assert first["keys_deleted"] == 2 and first["keys_remaining"] == 0
+        assert first["async_mode"] is second["async_mode"] is not legacy
+        assert switcher._has_async_flush is not legacy
\ No newline at end of file
@@ -0,0 +1,205 @@
+"""Tests for the Redis command executor."""
+
+from unittest.mock import Mock
+
+import pytest
+from redis.exceptions import ResponseError
+
+from redis_mcp.config.settings import RedisSettings, RedisMode
+from redis_mcp.connection.manager import RedisConnectionManager
+from redis_mcp.tools.executor import CommandExecutor
+from redis_mcp.utils.helpers import safe_json_serialize
+
+
+COMMAND_TABLE = {
+    "get": {"name": "get", "arity": 2, "flags": ["readonly", "fast"]},
+    "set": {"name": "set", "arity": -3, "flags": ["write", "denyoom"]},
+    "mset": {"name": "mset", "arity": -3, "flags": ["write", "denyoom"]},
+    "flushall": {"name": "flushall", "arity": -1, "flags": ["write"]},
+}
+
+
+class TestCommandExecutor:
+    """Test batch command execution."""
+    
+    @pytest.fixture
+    def connection(self):
+        """Mock pooled connection that records packed commands."""
+        connection = Mock()
+        connection.pack_commands.side_effect = lambda commands: list(commands)
+        connection.read_response.return_value = "OK"
+        return connection
+    
+    @pytest.fixture
+    def executor(self, connection):
+        """Executor wired to a client whose pool hands out the mock connection."""
+        settings = RedisSettings(redis_mode=RedisMode.SINGLE)
+        manager = RedisConnectionManager(settings)
+        manager._client = Mock()
+        manager._client.connection_pool.get_connection.return_value = connection
+        return CommandExecutor(manager, settings)
+    
+    def test_fire_and_forget(self, executor, connection):
+        """Test commands are sent in one write between CLIENT REPLY OFF/ON."""
+        result = executor.execute_batch_commands(
+            ["SET a 1", ["INCR", "b"]],
+            fire_and_forget=True
+        )
+        
+        connection.send_command.assert_called_once_with("CLIENT", "REPLY", "ON")
+        connection.send_packed_command.assert_called_once_with([
+            ("CLIENT", "REPLY", "OFF"),
+            ["SET", "a", "1"],
+            ["INCR", "b"],
+            ("CLIENT", "REPLY", "ON"),
+        ])
+        assert connection.read_response.call_count == 2
+        assert result.successful_commands == 2
+        assert [r.result for r in result.results] == [None, None]
+        executor.connection_manager._client.connection_pool.release.assert_called_once_with(connection)
+    
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_fire_and_forget_blocks_dangerous_commands(self, executor, connection, enabled):
+        """Test dangerous commands reject the whole batch even when enabled."""
+        executor.settings.enable_dangerous_commands = enabled
+        
+        result = executor.execute_pipeline(["SET a 1", "FLUSHALL"], fire_and_forget=True)
+        
+        assert result.failed_commands == 2
+        assert [r.command for r in result.results] == ["SET a 1", "FLUSHALL"]
+        assert result.results[-1].error == "Batch contains dangerous command 'FLUSHALL'"
+        assert not isinstance(result.results, list)
+        assert safe_json_serialize(result)["results"][0]["command"] == "SET a 1"
+        connection.send_packed_command.assert_not_called()
+    
+    def test_fire_and_forget_drops_failed_connection(self, executor, connection):
+        """Test a connection that failed mid-write is disconnected."""
+        connection.read_response.side_effect = ConnectionError("reset")
+        
+        result = executor.execute_batch_commands(["SET a 1"], fire_and_forget=True)
+        
+        assert result.failed_commands == 1
+        assert result.results[0].error.startswith("Fire-and-forget batch failed")
+        connection.disconnect.assert_called_once()
+    
+    def test_fire_and_forget_reports_unknown_outcome(self, executor, connection):
+        """Test a failure after the batch was written is not reported as plain failure."""
+        executor._has_client_reply = True
+        connection.read_response.side_effect = ConnectionError("reset")
+        
+        result = executor.execute_batch_commands(["SET a 1"], fire_and_forget=True)
+        
+        assert "outcome unknown" in result.results[0].error
+    
+    def test_fire_and_forget_without_client_reply(self, executor, connection):
+        """Test a server refusing CLIENT REPLY gets a regular pipeline before anything is sent."""
+        connection.read_response.side_effect = ResponseError("unknown subcommand 'REPLY'")
+        pipeline = executor.connection_manager._client.pipeline.return_value
+        pipeline.execute.return_value = ["OK"]
+        
+        first = executor.execute_batch_commands(["SET a 1"], fire_and_forget=True)
+        second = executor.execute_batch_commands(["SET a 1"], fire_and_forget=True)
+        
+        assert first.successful_commands == second.successful_commands == 1
+        connection.send_command.assert_called_once()
+        connection.send_packed_command.assert_not_called()
+        assert pipeline.execute.call_count == 2
+    
+    def test_batch_uses_one_pipeline(self, executor):
+        """Test batches are pipelined with blocked and failed commands reported in place."""
+        pipeline = executor.connection_manager._client.pipeline.return_value
+        pipeline.execute.return_value = ["OK", ResponseError("WRONGTYPE"), b"1"]
+        
+        result = executor.execute_batch_commands(["SET a 1", "FLUSHALL", ["LPUSH", "a", "x"], "GET b"])
+        
+        executor.connection_manager._client.pipeline.assert_called_once_with(transaction=False)
+        assert pipeline.execute_command.call_count == 3
+        assert [r.success for r in result.results] == [True, False, False, True]
+        assert "blocked" in result.results[1].error
+        assert result.results[2].error == "WRONGTYPE"
+        assert result.results[3].result == "1"
+        assert (result.successful_commands, result.failed_commands) == (2, 2)
+    
+    def test_pipeline_is_flushed_in_chunks(self, executor):
+        """Test a failed chunk does not stop later chunks."""
+        executor.settings.pipeline_chunk_size = 2
+        pipeline = executor.connection_manager._client.pipeline.return_value
+        pipeline.execute.side_effect = [["OK", "OK"], ConnectionError("reset"), ["OK"]]
+        
+        result = executor.execute_pipeline([f"SET k{i} v" for i in range(5)])
+        
+        assert pipeline.execute.call_count == 3
+        assert [r.success for r in result.results] == [True, True, False, False, True]
+        assert (result.successful_commands, result.failed_commands) == (3, 2)
+    
+    def test_command_info_is_cached(self, executor):
+        """Test the command table is fetched once and refetched on refresh."""
+        client = executor.connection_manager._client
+        client.command.return_value = COMMAND_TABLE
+        
+        get = executor.get_command_info("get")
+        flushall = executor.get_command_info("FLUSHALL")
+        missing = executor.get_command_info("nosuch")
+        
+        assert get["exists"] and get["info"]["readonly"]
+        assert get["info"]["flags"] == ["readonly", "fast"]
+        assert flushall["exists"] and flushall["blocked"]
+        assert missing["exists"] is False and missing["info"] is None
+        assert client.command.call_count == 1
+        
+        executor.get_command_info("get", refresh=True)
+        assert client.command.call_count == 2
+    
+    def test_pipeline_rejects_wrong_arity_locally(self, executor):
+        """Test malformed commands fail the pipeline without a round-trip."""
+        client = executor.connection_manager._client
+        client.command.return_value = COMMAND_TABLE
+        
+        result = executor.execute_pipeline(["SET a 1", "GET a b", "MSET a 1 b 2"])
+        
+        client.pipeline.assert_not_called()
+        assert result.failed_commands == 3
+        assert "wrong number of arguments for 'get' command" in result.results[0].error
+    
+    def test_read_only_blocks_write_commands(self, executor):
+        """Test write-flagged commands are dangerous in read-only mode."""
+        executor.connection_manager._client.command.return_value = COMMAND_TABLE
+        executor.settings.read_only = True
+        
+        assert executor.execute_command("SET", "a", "1").error.startswith("Command 'SET' is blocked")
+        assert not executor._is_dangerous_command("GET")
+    
+    def test_read_only_fails_closed_on_transient_errors(self, executor):
+        """Test a failed COMMAND fetch blocks commands in read-only mode and is retried."""
+        client = executor.connection_manager._client
+        client.command.side_effect = [ConnectionError("reset"), COMMAND_TABLE]
+        executor.settings.read_only = True
+        
+        first = executor.execute_command("SET", "a", "1")
+        second = executor.execute_command("SET", "a", "1")
+        
+        assert first.error.startswith("Command 'SET' is blocked")
+        assert second.error.startswith("Command 'SET' is blocked")
+        assert not executor._is_dangerous_command("GET")
+        assert client.command.call_count == 2
+        client.execute_command.assert_not_called()
+    
+    @pytest.mark.parametrize("result,command,expected", [
+        (None, "GET a", None),
+        (42, "INCR a", 42),
+        (b"value", "GET a", "value"),
+        (b"\xff\xfe", "GET a", "<binary data: 2 bytes>"),
+        (list(range(5)), "LRANGE a 0 -1", list(range(5))),
+        (list(range(200)), "KEYS *", list(range(200))),
+        ("x" * 10, "GET a", "x" * 10),
+        (b"\x0bpayload", "DUMP a", "<binary data: 8 bytes>"),
+    ])
+    def test_format_result(self, executor, result, command, expected):
+        """Test replies that are returned unchanged or decoded."""
+        assert executor._format_result(result, command) == expected
+    
+    def test_format_result_truncates_large_replies(self, executor):
+        """Test long lists, wide dicts and long strings are summarized."""
+        assert executor._format_result(list(range(200)), "LRANGE a 0 -1")["total_items"] == 200
+        assert executor._format_result({str(i): i for i in range(60)}, "INFO")["total_fields"] == 60
+        assert executor._format_result("x" * 2000, "GET a")["length"] == 2000
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""Tests for helper utilities."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from redis_mcp.config.settings import RedisMode
+from redis_mcp.tools.analyzer import KeyInfo
+from redis_mcp.utils.helpers import (
+    format_bytes, format_bytes_bulk, format_duration, safe_json_serialize
+)
+
+
+class TestSafeJsonSerialize:
+    """Test conversion of Redis replies to JSON-compatible values."""
+    
+    def test_nested_values(self):
+        """Test bytes, tuples, sets and non-string keys are converted."""
+        result = safe_json_serialize({
+            "value": b"hello",
+            "binary": b"\xff\xfe",
+            "pair": ("a", 1),
+            "members": {b"x"},
+            1: None,
+        })
+        
+        assert result == {
+            "value": "hello",
+            "binary": "<binary data: 2 bytes>",
+            "pair": ["a", 1],
+            "members": ["x"],
+            "1": None,
+        }
+    
+    def test_bytes_keys_fall_back(self):
+        """Test bytes dict keys fall back to str()."""
+        assert safe_json_serialize({b"key": 1}) == {"b'key'": 1}
+    
+    def test_slotted_dataclass(self):
+        """Test slotted dataclasses serialize field by field."""
+        key_info = KeyInfo("k", "string", 1, None, b"raw", None)
+        
+        assert safe_json_serialize([key_info])[0]["encoding"] == "raw"
+    
+    def test_deep_nesting(self):
+        """Test values nested past the recursion limit are converted."""
+        value = b"leaf"
+        for _ in range(5000):
+            value = [{"child": value}]
+        
+        result = safe_json_serialize(value)
+        
+        for _ in range(5000):
+            result = result[0]["child"]
+        assert result == "leaf"
+    
+    def test_homogeneous_sequences(self):
+        """Test single-type members are copied and mixed members converted."""
+        assert sorted(safe_json_serialize({"a", "b"})) == ["a", "b"]
+        assert safe_json_serialize((1, 2)) == [1, 2]
+        assert safe_json_serialize(("a", b"b", 1)) == ["a", "b", 1]
+    
+    def test_colliding_keys_keep_last_value(self):
+        """Test keys that stringify alike keep the last value, in first position."""
+        assert list(safe_json_serialize({1: "a", "b": 2, "1": "c"}).items()) == [("1", "c"), ("b", 2)]
+    
+    @pytest.mark.parametrize("value,expected", [
+        ({True: 1, None: 2}, {"True": 1, "None": 2}),
+        ({RedisMode.CLUSTER: RedisMode.SINGLE}, {"RedisMode.CLUSTER": "single"}),
+        (datetime(2024, 1, 1), "2024-01-01 00:00:00"),
+        ([float("nan"), float("inf"), 1.5], [None, None, 1.5]),
+    ])
+    def test_special_values(self, value, expected):
+        """Test non-str keys, enums, datetimes and non-finite floats."""
+        assert json.loads(json.dumps(safe_json_serialize(value))) == expected
+
+
+@pytest.mark.parametrize("size,expected", [
+    (0, "0 B"),
+    (0.5, "0.5 B"),
+    (1023, "1023.0 B"),
+    (1024, "1.0 KB"),
+    (1536, "1.5 KB"),
+    (1048575, "1024.0 KB"),
+    (5 * 1024 ** 3, "5.0 GB"),
+    (1024 ** 6, "1024.0 PB"),
+    (-2048, "-2048.0 B"),
+])
+def test_format_bytes(size, expected):
+    """Test the unit picked from the bit length matches repeated division."""
+    assert format_bytes(size) == expected
+
+
+def test_format_bytes_bulk():
+    """Test the bulk variant agrees with format_bytes()."""
+    sizes = [0, 1, 1023, 1024, 1536, 1048575, 5 * 1024 ** 3, 1024 ** 6, -2048, 1536.5]
+    
+    assert format_bytes_bulk(sizes) == [format_bytes(size) for size in sizes]
+
+
+@pytest.mark.parametrize("seconds,expected", [
+    (0.0012, "1.2ms"),
+    (5, "5.0s"),
+    (90, "1m 30.0s"),
+    (3599.5, "59m 59.5s"),
+    (3600, "1h 0m"),
+    (93784.5, "26h 3m"),
+])
+def test_format_duration(seconds, expected):
+    """Test each duration tier, for integer and float seconds."""
+    assert format_duration(seconds) == expected
\ No newline at end of file
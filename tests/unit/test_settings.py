@@ -55,7 +55,7 @@ class TestRedisSettings:
         with patch.dict(os.environ, env_vars):
             settings = RedisSettings()
             
-            assert settings.redis_cluster_nodes == ["node1:7000", "node2:7001", "node3:7002"]
+            assert settings.redis_cluster_nodes == (("node1", 7000), ("node2", 7001), ("node3", 7002))
     
     def test_sentinel_hosts_parsing(self):
         """Test parsing of sentinel hosts from string."""
@@ -66,11 +66,11 @@ class TestRedisSettings:
         with patch.dict(os.environ, env_vars):
             settings = RedisSettings()
             
-            expected_hosts = [
-                {"host": "sentinel1", "port": 26379},
-                {"host": "sentinel2", "port": 26379},
-                {"host": "sentinel3", "port": 26379}
-            ]
+            expected_hosts = (
+                ("sentinel1", 26379),
+                ("sentinel2", 26379),
+                ("sentinel3", 26379)
+            )
             assert settings.redis_sentinel_hosts == expected_hosts
     
     def test_redis_url_priority(self):
@@ -115,4 +115,13 @@ class TestRedisSettings:
         # Safe commands should not be in the list
         assert "GET" not in dangerous_commands
         assert "SET" not in dangerous_commands
-        assert "KEYS" not in dangerous_commands
\ No newline at end of file
+        assert "KEYS" not in dangerous_commands
+    
+    def test_dangerous_commands_normalized(self):
+        """Test custom dangerous commands are upper-cased into a frozenset."""
+        settings = RedisSettings(dangerous_commands=["flushdb", " Keys "])
+        
+        assert settings.dangerous_commands == frozenset({"FLUSHDB", "KEYS"})
+        assert settings.is_dangerous("keys")
+        assert settings.is_dangerous("FlushDB")
+        assert not settings.is_dangerous("get")
\ No newline at end of file